@@ -0,0 +1,40 @@
+"""agent_definitions server-side created_at default
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2025-12-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Let Postgres fill created_at on insert."""
+    op.alter_column(
+        'agent_definitions',
+        'created_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    """Remove the created_at server default."""
+    op.alter_column(
+        'agent_definitions',
+        'created_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=None,
+    )
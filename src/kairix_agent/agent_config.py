@@ -1,17 +1,20 @@
 """Cached agent configuration loaded from Letta on first access.
 
 This module provides a per-agent cache for agent configuration that is
-loaded from Letta on first access. The cache is keyed by agent_id so
-multiple agents can be monitored simultaneously.
+loaded from Letta on first access and refreshed after a TTL. The cache is
+keyed by agent_id and Letta URL so multiple agents can be monitored
+simultaneously.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass
 
-from letta_client import AsyncLetta
+from kairix_agent.config import Config
+from kairix_agent.letta_clients import get_letta_client
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +31,26 @@ class AgentConfig:
     insights_agent_id: str | None
 
 
-# Module-level cache keyed by agent_id
-_agent_configs: dict[str, AgentConfig] = {}
-_config_lock = asyncio.Lock()
+# Seconds a loaded config is reused before it is read from Letta again
+AGENT_CONFIG_TTL_SECONDS = 300.0
+
+# Module-level cache keyed by (agent_id, letta_url), storing (loaded_at, config)
+_agent_configs: dict[tuple[str, str], tuple[float, AgentConfig]] = {}
+# One lock per key, so loads for different agents run concurrently while
+# concurrent loads for the same agent still happen only once
+_config_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+
+def _cached_config(key: tuple[str, str]) -> AgentConfig | None:
+    """Get a cached config if it was loaded within the TTL."""
+    cached = _agent_configs.get(key)
+    if cached is not None and time.monotonic() - cached[0] < AGENT_CONFIG_TTL_SECONDS:
+        return cached[1]
+    return None
 
 
 async def get_agent_config(*, agent_id: str, letta_url: str) -> AgentConfig:
-    """Get the cached agent configuration, loading from Letta on first access.
+    """Get the cached agent configuration, loading from Letta when missing or stale.
 
     Args:
         agent_id: The agent ID to load configuration for.
@@ -43,18 +59,20 @@ async def get_agent_config(*, agent_id: str, letta_url: str) -> AgentConfig:
     Returns:
         AgentConfig with agent details including archive ID.
     """
+    key = (agent_id, letta_url)
+
     # Check cache first (no lock needed for read)
-    if agent_id in _agent_configs:
-        return _agent_configs[agent_id]
+    if (config := _cached_config(key)) is not None:
+        return config
 
-    async with _config_lock:
+    async with _config_locks.setdefault(key, asyncio.Lock()):
         # Double-check after acquiring lock
-        if agent_id in _agent_configs:
-            return _agent_configs[agent_id]
+        if (config := _cached_config(key)) is not None:
+            return config
 
         logger.info("Loading agent configuration from Letta for agent %s...", agent_id)
 
-        client = AsyncLetta(base_url=letta_url)
+        client = get_letta_client(letta_url)
 
         # Get agent details
         agent = await client.agents.retrieve(agent_id=agent_id)
@@ -102,7 +120,7 @@ async def get_agent_config(*, agent_id: str, letta_url: str) -> AgentConfig:
             insights_agent_id=insights_agent_id,
         )
 
-        _agent_configs[agent_id] = config
+        _agent_configs[key] = (time.monotonic(), config)
 
         logger.info(
             "Agent config loaded: name=%s, archive=%s, reflector=%s, insights=%s",
@@ -115,6 +133,39 @@ async def get_agent_config(*, agent_id: str, letta_url: str) -> AgentConfig:
         return config
 
 
+async def get_agent_configs(agents: list[tuple[str, str]]) -> dict[str, AgentConfig]:
+    """Load configs for several agents concurrently, warming the cache.
+
+    At most MAX_CONCURRENT_AGENTS loads run at once. Failures are logged and
+    left out of the result, so one unreachable agent does not stop the rest
+    from loading; callers retry it via get_agent_config.
+
+    Args:
+        agents: (agent_id, letta_url) pairs to load.
+
+    Returns:
+        Mapping of agent ID to config for every agent that loaded.
+    """
+    limiter = asyncio.Semaphore(Config.MAX_CONCURRENT_AGENTS.value)
+
+    async def load(agent_id: str, letta_url: str) -> AgentConfig:
+        async with limiter:
+            return await get_agent_config(agent_id=agent_id, letta_url=letta_url)
+
+    results = await asyncio.gather(
+        *(load(agent_id, letta_url) for agent_id, letta_url in agents),
+        return_exceptions=True,
+    )
+
+    configs: dict[str, AgentConfig] = {}
+    for (agent_id, _), result in zip(agents, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("Failed to load agent config for %s: %s", agent_id, result)
+        else:
+            configs[agent_id] = result
+    return configs
+
+
 def clear_agent_config(agent_id: str | None = None) -> None:
     """Clear the cached agent config.
 
@@ -123,5 +174,6 @@ def clear_agent_config(agent_id: str | None = None) -> None:
     """
     if agent_id is None:
         _agent_configs.clear()
-    elif agent_id in _agent_configs:
-        del _agent_configs[agent_id]
+        return
+    for key in [key for key in _agent_configs if key[0] == agent_id]:
+        del _agent_configs[key]
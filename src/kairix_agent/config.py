@@ -32,6 +32,9 @@ class Config(Enum):
     # Worker agent monitoring (comma-separated list of agent IDs)
     MONITORED_AGENT_IDS = os.getenv("MONITORED_AGENT_IDS", "")
 
+    # Maximum agents a worker job checks at once (caps concurrent load on Letta)
+    MAX_CONCURRENT_AGENTS = int(os.getenv("MAX_CONCURRENT_AGENTS", "8"))
+
     # External API keys (for voice pipeline)
     DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY", "")
     ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
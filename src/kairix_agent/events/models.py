@@ -1,6 +1,6 @@
 """SQLAlchemy models for agent events."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from uuid import uuid4
 
@@ -40,5 +40,5 @@ class AgentEvent(Base):
     payload: Mapped[dict] = mapped_column(JSONB, default=dict)  # type: ignore[type-arg]
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        default=lambda: datetime.now(UTC),
     )
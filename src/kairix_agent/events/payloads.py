@@ -6,7 +6,9 @@ from pydantic import BaseModel
 class SessionBoundaryPayload(BaseModel):
     """Payload for SESSION_BOUNDARY events.
 
-    Emitted every time the boundary check runs for an agent.
+    Emitted every time the boundary check runs for an agent. A check that finds
+    the session active from the newest message alone does not count the
+    conversation, so it reports message_count as 0.
     """
 
     boundary_detected: bool
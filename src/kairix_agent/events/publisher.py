@@ -2,6 +2,7 @@
 
 import logging
 
+import orjson
 import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -11,7 +12,15 @@ from kairix_agent.events.models import AgentEvent, EventType
 logger = logging.getLogger(__name__)
 
 # Async engine and session factory (lazy initialized)
-_engine = create_async_engine(Config.DATABASE_URL.value, echo=False)
+# Sized for bursts of concurrent publishes from worker jobs
+_engine = create_async_engine(
+    Config.DATABASE_URL.value,
+    echo=False,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 _async_session = async_sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
 
 # Redis client (lazy initialized)
@@ -49,13 +58,24 @@ async def publish_event(
             payload=payload or {},
         )
         session.add(event)
+        # id and created_at are generated client-side, so the committed event is
+        # complete without reading the row back
         await session.commit()
-        await session.refresh(event)
 
-    # 2. Notify via Redis pub/sub (for real-time streaming)
+    # 2. Notify via Redis pub/sub (for real-time streaming), carrying the serialized
+    # event so listeners can forward it without reading it back from Postgres
     r = await _get_redis()
     channel = f"agent_events:{agent_id}"
-    await r.publish(channel, event.id)
+    message = orjson.dumps(
+        {
+            "id": event.id,
+            "agent_id": event.agent_id,
+            "event_type": event.event_type,
+            "payload": event.payload,
+            "created_at": event.created_at,
+        }
+    )
+    await r.publish(channel, message)
     logger.debug("Published event %s to Redis channel %s", event.id, channel)
 
     return event
@@ -0,0 +1,50 @@
+"""Shared Letta clients.
+
+This module keeps one AsyncLetta client per Letta server URL so every
+caller in a process reuses the same HTTP connection pool instead of
+opening new connections for each client it constructs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from letta_client import AsyncLetta, DefaultAsyncHttpxClient
+
+from kairix_agent.config import Config
+
+# Keep more idle connections than the SDK default (20) so concurrent streams reuse them
+_CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
+# Module-level cache keyed by base URL
+_clients: dict[str, AsyncLetta] = {}
+
+
+def get_letta_client(base_url: str | None = None) -> AsyncLetta:
+    """Get the shared Letta client for a server, creating it on first use.
+
+    Args:
+        base_url: The Letta server URL (defaults to LETTA_BASE_URL env var).
+
+    Returns:
+        The AsyncLetta client shared by all callers using this URL.
+    """
+    if base_url is None:
+        base_url = Config.LETTA_BASE_URL.value
+
+    client = _clients.get(base_url)
+    if client is None:
+        client = AsyncLetta(
+            base_url=base_url,
+            http_client=DefaultAsyncHttpxClient(limits=_CONNECTION_LIMITS),
+        )
+        _clients[base_url] = client
+    return client
+
+
+async def close_letta_clients() -> None:
+    """Close every shared Letta client, e.g. when a process shuts down."""
+    clients = list(_clients.values())
+    _clients.clear()
+    await asyncio.gather(*(client.close() for client in clients))
@@ -10,10 +10,9 @@ from collections.abc import AsyncIterator
 from datetime import datetime
 from logging import getLogger
 
-from letta_client import AsyncLetta
-from letta_client.types.agents import Message
+from letta_client.types.agents import Message, MessageType
 
-from kairix_agent.config import Config
+from kairix_agent.letta_clients import get_letta_client
 from kairix_agent.memory.models import ConversationSummary
 
 logger = getLogger(__name__)
@@ -35,9 +34,7 @@ class LettaMemoryService:
             archive_id: The Letta archive ID for storing passages.
             base_url: The Letta server URL (defaults to LETTA_BASE_URL env var).
         """
-        if base_url is None:
-            base_url = Config.LETTA_BASE_URL.value
-        self.client = AsyncLetta(base_url=base_url)
+        self.client = get_letta_client(base_url)
         self.agent_id = agent_id
         self.archive_id = archive_id
 
@@ -45,6 +42,7 @@ class LettaMemoryService:
         self,
         after_message_id: str | None = None,
         limit: int = 100,
+        message_types: list[MessageType] | None = None,
     ) -> AsyncIterator[Message]:
         """Get messages since a cursor position.
 
@@ -54,6 +52,8 @@ class LettaMemoryService:
         Args:
             after_message_id: Message ID to start after (exclusive).
             limit: Maximum messages per page.
+            message_types: Only return messages of these types (filtered by
+                the server). Defaults to all types.
 
         Yields:
             Message objects in chronological order.
@@ -64,6 +64,7 @@ class LettaMemoryService:
             agent_id=self.agent_id,
             after=after_message_id,
             limit=limit,
+            include_return_message_types=message_types,
             order="asc",
             order_by="created_at",
         )
@@ -71,6 +72,28 @@ class LettaMemoryService:
         async for message in paginator:
             yield message
 
+    async def get_latest_message(
+        self,
+        message_types: list[MessageType] | None = None,
+    ) -> Message | None:
+        """Get the agent's most recent message without paging through history.
+
+        Args:
+            message_types: Only consider messages of these types (filtered by
+                the server). Defaults to all types.
+
+        Returns:
+            The newest message, or None if the agent has none.
+        """
+        page = await self.client.agents.messages.list(
+            agent_id=self.agent_id,
+            limit=1,
+            include_return_message_types=message_types,
+            order="desc",
+            order_by="created_at",
+        )
+        return page.items[0] if page.items else None
+
     async def store_summary(self, summary: ConversationSummary) -> str:
         """Store a summary as a passage in archival memory.
 
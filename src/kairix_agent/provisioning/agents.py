@@ -13,7 +13,7 @@ from kairix_agent.provisioning.blocks import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentSpec:
     """Specification for an agent to be provisioned.
 
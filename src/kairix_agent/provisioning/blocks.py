@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import ClassVar
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BlockDefinition:
     """Definition of a memory block to be provisioned."""
 
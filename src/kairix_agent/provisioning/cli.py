@@ -13,7 +13,8 @@ import argparse
 import asyncio
 import logging
 import sys
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any, cast
 
 from letta_client import AsyncLetta, ConflictError
 
@@ -25,15 +26,119 @@ from kairix_agent.provisioning.agents import (
     create_reflector_agent,
 )
 from kairix_agent.provisioning.blocks import BlockDefinition  # noqa: TC001
-from kairix_agent.provisioning.prompts import get_system_prompt
+from kairix_agent.provisioning.prompts import close_engine, get_system_prompt
 
 if TYPE_CHECKING:
-    from letta_client.types import BlockResponse
+    from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+
+    from letta_client.types import AgentState, BlockResponse
     from letta_client.types.archive import Archive
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+# How long a fetched block/archive/tool lookup stays valid within one process
+INVENTORY_TTL_SECONDS = 60.0
+
+# Max label-filtered block list requests in flight at once
+BLOCK_LOOKUP_CONCURRENCY = 8
+
+# Label -> (fetched_at, block), with None recorded for labels that have no block
+_blocks_by_label: dict[str, tuple[float, BlockResponse | None]] = {}
+
+# Name -> (fetched_at, archive), with None recorded for names that have no archive
+_archives_by_name: dict[str, tuple[float, Archive | None]] = {}
+
+
+async def _lookup_block(
+    client: AsyncLetta,
+    label: str,
+    limiter: asyncio.Semaphore,
+) -> BlockResponse | None:
+    """Find the existing block with a label, reusing a recent lookup if available."""
+    cached = _blocks_by_label.get(label)
+    if cached is not None and time.monotonic() - cached[0] < INVENTORY_TTL_SECONDS:
+        return cached[1]
+
+    block: BlockResponse | None = None
+    async with limiter:
+        # Last match wins, as it did when indexing the full block listing
+        async for match in client.blocks.list(label=label):
+            block = match
+    _blocks_by_label[label] = (time.monotonic(), block)
+    return block
+
+
+async def _index_blocks(client: AsyncLetta, labels: Iterable[str]) -> dict[str, BlockResponse]:
+    """Get the existing blocks for the given labels, keyed by label.
+
+    Each label is a separate filtered query, so only blocks the caller can
+    actually use are transferred rather than every block in the system.
+    """
+    wanted = sorted(set(labels))
+    limiter = asyncio.Semaphore(BLOCK_LOOKUP_CONCURRENCY)
+    found = await asyncio.gather(*(_lookup_block(client, label, limiter) for label in wanted))
+    return {label: block for label, block in zip(wanted, found, strict=True) if block}
+
+
+async def _lookup_archive(client: AsyncLetta, name: str) -> Archive | None:
+    """Find the existing archive with a name, reusing a recent lookup if available."""
+    cached = _archives_by_name.get(name)
+    if cached is not None and time.monotonic() - cached[0] < INVENTORY_TTL_SECONDS:
+        return cached[1]
+
+    archive: Archive | None = None
+    async for match in client.archives.list(name=name):
+        archive = match
+    _archives_by_name[name] = (time.monotonic(), archive)
+    return archive
+
+
+async def _index_archives(client: AsyncLetta, names: Iterable[str]) -> dict[str, Archive]:
+    """Get the existing archives for the given names, keyed by name."""
+    wanted = sorted(set(names))
+    found = await asyncio.gather(*(_lookup_archive(client, name) for name in wanted))
+    return {name: archive for name, archive in zip(wanted, found, strict=True) if archive}
+
+
+_tool_index: tuple[float, dict[str, str]] | None = None
+
+# Agent name -> ID for agents already found during this process
+_agent_ids: dict[str, str] = {}
+_agent_ids_lock = asyncio.Lock()
+
+# Agent ID -> (label -> block ID) for agents whose blocks were listed during this process
+_agent_blocks: dict[str, dict[str, str]] = {}
+
+
+async def _load_tool_index(client: AsyncLetta) -> dict[str, str]:
+    """Get a tool name -> tool ID map, fetching the tool catalog at most once per TTL."""
+    global _tool_index
+    if _tool_index is not None and time.monotonic() - _tool_index[0] < INVENTORY_TTL_SECONDS:
+        return _tool_index[1]
+
+    index = {tool.name: tool.id async for tool in client.tools.list() if tool.name}
+    _tool_index = (time.monotonic(), index)
+    return index
+
+
+async def _create_block(client: AsyncLetta, block_def: BlockDefinition) -> BlockResponse:
+    """Create a new block from its definition.
+
+    All block creation goes through here so instrumentation or batching
+    only needs to be added in one place.
+    """
+    block = await client.blocks.create(
+        label=block_def.label,
+        value=block_def.initial_value,
+        description=block_def.description,
+        limit=block_def.limit,
+        read_only=block_def.read_only,
+    )
+    if block.label:
+        _blocks_by_label[block.label] = (time.monotonic(), block)
+    return block
+
 
 async def find_or_create_block(
     client: AsyncLetta,
@@ -47,17 +152,65 @@ async def find_or_create_block(
         return block.id
 
     # Create new block
-    block = await client.blocks.create(
-        label=block_def.label,
-        value=block_def.initial_value,
-        description=block_def.description,
-        limit=block_def.limit,
-        read_only=block_def.read_only,
-    )
+    block = await _create_block(client, block_def)
     logger.info("  Created new block: %s (%s)", block_def.label, block.id)
     return block.id
 
 
+async def _find_agent_id(client: AsyncLetta, name: str) -> str | None:
+    """Return the ID of the first agent whose name matches exactly, or None.
+
+    Found IDs are cached for the rest of the process, so the several lookups of
+    the conversational agent during one provisioning run hit Letta only once.
+    Misses are not cached since the agent may be created later in the run.
+    """
+    # Check cache first (no lock needed for read)
+    if name in _agent_ids:
+        return _agent_ids[name]
+
+    async with _agent_ids_lock:
+        # Double-check after acquiring lock
+        if name in _agent_ids:
+            return _agent_ids[name]
+
+        # Stop at the first match and close the listing right away
+        # instead of leaving it to be cleaned up by garbage collection
+        agents = cast("AsyncGenerator[AgentState]", aiter(client.agents.list(name=name)))
+        try:
+            agent = await anext((a async for a in agents if a.name == name), None)
+        finally:
+            await agents.aclose()
+
+        if agent is None:
+            return None
+        _agent_ids[name] = agent.id
+        return agent.id
+
+
+async def _blocks_map(client: AsyncLetta, agent_id: str) -> dict[str, str]:
+    """Get label -> block_id for every block attached to an agent.
+
+    The listing is kept for the rest of the process and dropped whenever this
+    module attaches or detaches one of the agent's blocks. Callers must treat
+    the returned dict as read-only.
+    """
+    blocks = _agent_blocks.get(agent_id)
+    if blocks is None:
+        # Uses the dedicated endpoint (agents.retrieve().memory.blocks is broken in SDK - returns empty)
+        blocks = {
+            block.label: block.id
+            async for block in client.agents.blocks.list(agent_id=agent_id)
+            if block.label
+        }
+        _agent_blocks[agent_id] = blocks
+    return blocks
+
+
+async def _collect_agent_archive_ids(client: AsyncLetta, agent_id: str) -> set[str]:
+    """Get the IDs of every archive attached to an agent."""
+    return {archive.id async for archive in client.archives.list(agent_id=agent_id)}
+
+
 async def find_agent_by_name(
     client: AsyncLetta,
     name: str,
@@ -67,23 +220,15 @@ async def find_agent_by_name(
     Returns:
         Tuple of (agent_id, dict of label -> block_id, set of archive ids) if found, None otherwise.
     """
-    async for agent in client.agents.list(name=name):
-        if agent.name == name:
-            # Get attached blocks via dedicated endpoint
-            # (agents.retrieve().memory.blocks is broken in SDK - returns empty)
-            existing_blocks: dict[str, str] = {}
-            async for block in client.agents.blocks.list(agent_id=agent.id):
-                if block.label:
-                    existing_blocks[block.label] = block.id
-                    logger.debug("  Found existing block: %s (%s)", block.label, block.id)
-
-            # Get attached archives
-            archive_ids: set[str] = set()
-            async for archive in client.archives.list(agent_id=agent.id):
-                archive_ids.add(archive.id)
-
-            return agent.id, existing_blocks, archive_ids
-    return None
+    agent_id = await _find_agent_id(client, name)
+    if agent_id is None:
+        return None
+
+    existing_blocks, archive_ids = await asyncio.gather(
+        _blocks_map(client, agent_id),
+        _collect_agent_archive_ids(client, agent_id),
+    )
+    return agent_id, existing_blocks, archive_ids
 
 
 async def provision_agent(
@@ -161,50 +306,42 @@ async def _remediate_existing_agent(
     logger.info("  System prompt updated")
 
     # Check blocks - both missing AND incorrect (wrong ID for shared blocks)
+    # Pass 1: work out the correct block ID for each label without any network calls
     shared_labels = {b.label for b in spec.shared_blocks}
-    blocks_need_fixing = False
+    to_create: list[BlockDefinition] = []
+    resolved: list[tuple[str, str | None, str]] = []  # (label, current_id, correct_id)
 
     for block_def in [*spec.shared_blocks, *spec.unique_blocks]:
         label = block_def.label
         current_block_id = existing_agent_blocks.get(label)
 
-        # Determine the correct block ID for this label
-        correct_block_id: str | None = None
         if label in shared_labels and shared_block_ids and label in shared_block_ids:
             # Shared block - must use the exact ID from conversational agent
-            correct_block_id = shared_block_ids[label]
+            resolved.append((label, current_block_id, shared_block_ids[label]))
         elif current_block_id:
             # Block exists and it's not a shared block requiring specific ID - keep it
             continue
         elif label in existing_blocks:
             # Use existing block from system
-            correct_block_id = existing_blocks[label].id
+            resolved.append((label, current_block_id, existing_blocks[label].id))
         else:
             # Need to create new block
-            block = await client.blocks.create(
-                label=block_def.label,
-                value=block_def.initial_value,
-                description=block_def.description,
-                limit=block_def.limit,
-                read_only=block_def.read_only,
-            )
-            correct_block_id = block.id
-            logger.info("  Created block: %s (%s)", label, correct_block_id)
-
-        # Check if we need to fix this block
-        if current_block_id is None:
-            # Block missing - attach it
-            logger.info("  Attaching missing block: %s (%s)", label, correct_block_id)
-            await client.agents.blocks.attach(agent_id=agent_id, block_id=correct_block_id)
-            blocks_need_fixing = True
-        elif current_block_id != correct_block_id:
-            # Wrong block attached - detach and attach correct one
-            logger.info("  Replacing incorrect block %s: %s -> %s", label, current_block_id, correct_block_id)
-            await client.agents.blocks.detach(agent_id=agent_id, block_id=current_block_id)
-            await client.agents.blocks.attach(agent_id=agent_id, block_id=correct_block_id)
-            blocks_need_fixing = True
-
-    if not blocks_need_fixing:
+            to_create.append(block_def)
+
+    # Pass 2: create missing blocks, then fix attachments, each batch concurrently
+    created = await asyncio.gather(*(_create_block(client, b) for b in to_create))
+    for block_def, block in zip(to_create, created, strict=True):
+        logger.info("  Created block: %s (%s)", block_def.label, block.id)
+        resolved.append((block_def.label, None, block.id))
+
+    fixes = [
+        _fix_agent_block(client, agent_id, label, current_id, correct_id)
+        for label, current_id, correct_id in resolved
+        if current_id != correct_id
+    ]
+    await asyncio.gather(*fixes)
+
+    if not fixes:
         logger.info("All required blocks present and correct")
 
     # Check archive attachment
@@ -219,37 +356,101 @@ async def _remediate_existing_agent(
         logger.info("Archive already attached")
 
     # Check for missing tools
-    if spec.tools:
-        existing_tool_names: set[str] = set()
-        async for tool in client.agents.tools.list(agent_id=agent_id):
-            if tool.name:
-                existing_tool_names.add(tool.name)
-
-        missing_tools = set(spec.tools) - existing_tool_names
-        if missing_tools:
-            logger.info("Agent missing tools: %s", missing_tools)
-            for tool_name in missing_tools:
-                # Find tool by name
-                tool_id: str | None = None
-                async for tool in client.tools.list():
-                    if tool.name == tool_name:
-                        tool_id = tool.id
-                        break
-                if tool_id:
-                    try:
-                        await no_retry_client.agents.tools.attach(agent_id=agent_id, tool_id=tool_id)
-                        logger.info("  Attached tool: %s", tool_name)
-                    except ConflictError:
-                        logger.info("  Tool %s already attached (conflict ignored)", tool_name)
-                else:
-                    logger.warning("  Tool not found: %s", tool_name)
-        else:
-            logger.info("All required tools present")
+    await _remediate_tools(client, no_retry_client, agent_id, spec.tools)
 
     logger.info("Agent remediation complete: %s", agent_id)
     return agent_id
 
 
+async def _remediate_tools(
+    client: AsyncLetta,
+    no_retry_client: AsyncLetta,
+    agent_id: str,
+    tools: list[str],
+) -> None:
+    """Attach any tools from the spec that the agent doesn't have yet."""
+    if not tools:
+        logger.info("No tools in spec")
+        return
+
+    attached = {tool.name async for tool in client.agents.tools.list(agent_id=agent_id) if tool.name}
+    missing_tools = set(tools) - attached
+    if not missing_tools:
+        logger.info("All required tools present")
+        return
+
+    logger.info("Agent missing tools: %s", missing_tools)
+    tool_index = await _load_tool_index(client)
+    await asyncio.gather(
+        *(
+            _attach_missing_tool(no_retry_client, agent_id, tool_name, tool_index)
+            for tool_name in sorted(missing_tools)
+        )
+    )
+
+
+async def _fix_agent_block(
+    client: AsyncLetta,
+    agent_id: str,
+    label: str,
+    current_block_id: str | None,
+    correct_block_id: str,
+) -> None:
+    """Attach the correct block for a label, detaching a wrong one first if present."""
+    _agent_blocks.pop(agent_id, None)
+    if current_block_id is None:
+        # Block missing - attach it
+        logger.info("  Attaching missing block: %s (%s)", label, correct_block_id)
+    else:
+        # Wrong block attached - detach and attach correct one
+        logger.info("  Replacing incorrect block %s: %s -> %s", label, current_block_id, correct_block_id)
+        await client.agents.blocks.detach(agent_id=agent_id, block_id=current_block_id)
+    await client.agents.blocks.attach(agent_id=agent_id, block_id=correct_block_id)
+
+
+async def _attach_tool(
+    client: AsyncLetta,
+    agent_id: str,
+    tool_name: str,
+    tool_index: dict[str, str],
+) -> None:
+    """Attach a tool by name, warning if no tool has that name."""
+    tool_id = tool_index.get(tool_name)
+    if not tool_id:
+        logger.warning("  Tool not found: %s", tool_name)
+        return
+    await client.agents.tools.attach(agent_id=agent_id, tool_id=tool_id)
+    logger.info("  Attached tool: %s", tool_name)
+
+
+async def _attach_missing_tool(
+    client: AsyncLetta,
+    agent_id: str,
+    tool_name: str,
+    tool_index: dict[str, str],
+) -> None:
+    """Attach a tool by name, ignoring an already-attached conflict."""
+    try:
+        await _attach_tool(client, agent_id, tool_name, tool_index)
+    except ConflictError:
+        logger.info("  Tool %s already attached (conflict ignored)", tool_name)
+
+
+async def _resolve_shared_block_id(
+    client: AsyncLetta,
+    block_def: BlockDefinition,
+    existing_blocks: dict[str, BlockResponse],
+    shared_block_ids: dict[str, str] | None,
+) -> str:
+    """Get the block ID to use for a shared block, creating it if needed."""
+    if shared_block_ids and block_def.label in shared_block_ids:
+        # Use the exact block ID from the conversational agent
+        block_id = shared_block_ids[block_def.label]
+        logger.info("  Using shared block: %s (%s)", block_def.label, block_id)
+        return block_id
+    return await find_or_create_block(client, block_def, existing_blocks)
+
+
 async def _create_new_agent(
     client: AsyncLetta,
     spec: AgentSpec,
@@ -260,32 +461,23 @@ async def _create_new_agent(
     """Create a new agent from scratch."""
     logger.info("Provisioning new agent: %s", spec.name)
 
-    # Collect block IDs
-    block_ids: list[str] = []
-
     # Shared blocks - use explicit IDs if provided, otherwise reuse existing or create
-    logger.info("Setting up shared blocks...")
-    for block_def in spec.shared_blocks:
-        if shared_block_ids and block_def.label in shared_block_ids:
-            # Use the exact block ID from the conversational agent
-            block_id = shared_block_ids[block_def.label]
-            logger.info("  Using shared block: %s (%s)", block_def.label, block_id)
-        else:
-            block_id = await find_or_create_block(client, block_def, existing_blocks)
-        block_ids.append(block_id)
-
     # Unique blocks - always create fresh
-    logger.info("Setting up unique blocks...")
-    for block_def in spec.unique_blocks:
-        block = await client.blocks.create(
-            label=block_def.label,
-            value=block_def.initial_value,
-            description=block_def.description,
-            limit=block_def.limit,
-            read_only=block_def.read_only,
-        )
+    # Both sets are independent, so any creates are issued concurrently
+    logger.info("Setting up shared and unique blocks...")
+    shared_ids, unique_blocks = await asyncio.gather(
+        asyncio.gather(
+            *(
+                _resolve_shared_block_id(client, block_def, existing_blocks, shared_block_ids)
+                for block_def in spec.shared_blocks
+            )
+        ),
+        asyncio.gather(*(_create_block(client, block_def) for block_def in spec.unique_blocks)),
+    )
+    for block_def, block in zip(spec.unique_blocks, unique_blocks, strict=True):
         logger.info("  Created unique block: %s (%s)", block_def.label, block.id)
-        block_ids.append(block.id)
+
+    block_ids = [*shared_ids, *(block.id for block in unique_blocks)]
 
     # Create the agent
     logger.info("Creating agent with %d blocks (include_base_tools=%s)...", len(block_ids), spec.include_base_tools)
@@ -304,37 +496,39 @@ async def _create_new_agent(
     )
 
     logger.info("Agent created: %s (%s)", spec.name, agent.id)
+    _agent_ids[spec.name] = agent.id
 
-    # Attach tools from spec
+    # Attach tools from spec and archive if provided - all independent, so issue together
+    attachments: list[Coroutine[Any, Any, None]] = []
     if spec.tools:
         logger.info("Attaching %d tools...", len(spec.tools))
-        for tool_name in spec.tools:
-            # Find tool by name
-            tool_id: str | None = None
-            async for tool in client.tools.list():
-                if tool.name == tool_name:
-                    tool_id = tool.id
-                    break
-            if tool_id:
-                await client.agents.tools.attach(agent_id=agent.id, tool_id=tool_id)
-                logger.info("  Attached tool: %s", tool_name)
-            else:
-                logger.warning("  Tool not found: %s", tool_name)
-
-    # Attach archive if provided
+        tool_index = await _load_tool_index(client)
+        attachments.extend(
+            _attach_tool(client, agent.id, tool_name, tool_index) for tool_name in spec.tools
+        )
     if archive_id:
         logger.info("Attaching archive %s to agent...", archive_id)
-        await client.agents.archives.attach(archive_id=archive_id, agent_id=agent.id)
-        logger.info("  Archive attached successfully")
+        attachments.append(_attach_archive(client, agent.id, archive_id))
+    await asyncio.gather(*attachments)
 
     return agent.id
 
 
+async def _attach_archive(client: AsyncLetta, agent_id: str, archive_id: str) -> None:
+    """Attach an archive to an agent."""
+    await client.agents.archives.attach(archive_id=archive_id, agent_id=agent_id)
+    logger.info("  Archive attached successfully")
+
+
 async def list_blocks(client: AsyncLetta) -> None:
-    """List all existing blocks."""
+    """List all existing blocks.
+
+    The blocks API has no metadata-only projection, so only each block's
+    character limit is reported rather than measuring its value.
+    """
     logger.info("Existing blocks:")
     async for block in client.blocks.list():
-        logger.info("  - %s (%s): %d chars", block.label, block.id, len(block.value))
+        logger.info("  - %s (%s): limit %s chars", block.label, block.id, block.limit)
 
 
 async def list_agents(client: AsyncLetta) -> None:
@@ -368,40 +562,37 @@ async def find_or_create_archive(
         description=f"Shared archival memory for {name} entity",
         embedding="openai/text-embedding-3-small",
     )
+    _archives_by_name[name] = (time.monotonic(), archive)
     logger.info("  Created new archive: %s (%s)", name, archive.id)
     return archive.id
 
 
 async def find_conversational_agent_archive(
     client: AsyncLetta,
-    base_name: str,
+    conv_agent_id: str,
 ) -> str | None:
     """Find the archive attached to the conversational agent.
 
     Args:
         client: Letta client.
-        base_name: The base agent name (e.g., "Corindel").
+        conv_agent_id: The conversational agent's ID.
 
     Returns:
         Archive ID if found, None otherwise.
     """
-    # Find the conversational agent by name
-    async for agent in client.agents.list(name=base_name):
-        # Get archives attached to this agent
-        async for archive in client.archives.list(agent_id=agent.id):
-            logger.info(
-                "  Found archive %s (%s) from conversational agent %s",
-                archive.name,
-                archive.id,
-                agent.name,
-            )
-            return archive.id
+    async for archive in client.archives.list(agent_id=conv_agent_id):
+        logger.info(
+            "  Found archive %s (%s) from conversational agent",
+            archive.name,
+            archive.id,
+        )
+        return archive.id
     return None
 
 
 async def get_conversational_agent_shared_blocks(
     client: AsyncLetta,
-    base_name: str,
+    conv_agent_id: str,
     shared_block_labels: set[str],
 ) -> dict[str, str]:
     """Get the block IDs for shared blocks from the conversational agent.
@@ -411,26 +602,67 @@ async def get_conversational_agent_shared_blocks(
 
     Args:
         client: Letta client.
-        base_name: The base agent name (e.g., "Corindel").
+        conv_agent_id: The conversational agent's ID.
         shared_block_labels: Set of labels to look for (e.g., {"persona", "human"}).
 
     Returns:
         Dict mapping label -> block_id for the shared blocks.
     """
-    # Find the conversational agent by name
-    async for agent in client.agents.list(name=base_name):
-        if agent.name == base_name:
-            shared_blocks: dict[str, str] = {}
-            async for block in client.agents.blocks.list(agent_id=agent.id):
-                if block.label in shared_block_labels:
-                    shared_blocks[block.label] = block.id
-                    logger.info(
-                        "  Found shared block %s (%s) from conversational agent",
-                        block.label,
-                        block.id,
-                    )
-            return shared_blocks
-    return {}
+    agent_blocks = _agent_blocks.get(conv_agent_id)
+    if agent_blocks is not None:
+        shared_blocks = {label: agent_blocks[label] for label in shared_block_labels if label in agent_blocks}
+        for label, block_id in shared_blocks.items():
+            logger.info("  Found shared block %s (%s) from conversational agent", label, block_id)
+        return shared_blocks
+
+    # Not listed yet - page through the blocks only until every label is found,
+    # rather than listing them all through _blocks_map
+    shared_blocks = {}
+    async for block in client.agents.blocks.list(agent_id=conv_agent_id):
+        if block.label in shared_block_labels:
+            shared_blocks[block.label] = block.id
+            logger.info(
+                "  Found shared block %s (%s) from conversational agent",
+                block.label,
+                block.id,
+            )
+            # Stop paging once every requested label has been found
+            if shared_blocks.keys() >= shared_block_labels:
+                break
+    return shared_blocks
+
+
+async def _lookup_conversational_agent_deps(
+    client: AsyncLetta,
+    base_name: str,
+    shared_block_labels: set[str],
+) -> tuple[str | None, dict[str, str]]:
+    """Find the conversational agent once and fetch its archive and shared blocks.
+
+    Args:
+        client: Letta client.
+        base_name: The base agent name (e.g., "Corindel").
+        shared_block_labels: Set of labels to look for (e.g., {"persona", "human"}).
+
+    Returns:
+        Tuple of (archive ID or None, dict of label -> block_id for shared blocks).
+        Both are empty if the conversational agent does not exist.
+    """
+    conv_agent_id = await _find_agent_id(client, base_name)
+    if conv_agent_id is None:
+        return None, {}
+
+    return await asyncio.gather(
+        find_conversational_agent_archive(client, conv_agent_id),
+        get_conversational_agent_shared_blocks(client, conv_agent_id, shared_block_labels),
+    )
+
+
+_SPEC_FACTORIES: dict[str, Callable[[str, str], AgentSpec]] = {
+    "conversational": create_conversational_agent,
+    "insights": create_background_insights_agent,
+    "reflector": create_reflector_agent,
+}
 
 
 async def _run_provisioning(
@@ -448,34 +680,30 @@ async def _run_provisioning(
     Returns:
         Exit code (0 for success, 1 for failure).
     """
-    # Load system prompt from database
+    create_spec = _SPEC_FACTORIES.get(agent_type, create_reflector_agent)
+
+    # A spec's blocks don't depend on its prompt, so the existing blocks it can
+    # reuse are looked up while the prompt loads
+    template = create_spec(base_name, "")
+    labels = {b.label for b in [*template.shared_blocks, *template.unique_blocks]}
+    # Only the conversational agent owns an archive, named after the agent
+    archive_names = {base_name} if agent_type == "conversational" else set()
+
+    # Load system prompt from database while fetching existing blocks and archives for reuse
     logger.info("Loading system prompt for %s from database...", agent_type)
     try:
-        system_prompt = await get_system_prompt(agent_type)
-        logger.info("  Loaded prompt (%d chars)", len(system_prompt))
+        system_prompt, existing_blocks, existing_archives = await asyncio.gather(
+            get_system_prompt(agent_type),
+            _index_blocks(client, labels),
+            _index_archives(client, archive_names),
+        )
     except ValueError as e:
         logger.error("Failed to load system prompt: %s", e)
         return 1
-
-    # Get all existing blocks for reuse
-    existing_blocks: dict[str, BlockResponse] = {}
-    async for block in client.blocks.list():
-        if block.label:
-            existing_blocks[block.label] = block
-
-    # Get all existing archives for reuse
-    existing_archives: dict[str, Archive] = {}
-    async for archive in client.archives.list():
-        if archive.name:
-            existing_archives[archive.name] = archive
+    logger.info("  Loaded prompt (%d chars)", len(system_prompt))
 
     # Create spec using factory methods with DB-loaded prompt
-    if agent_type == "conversational":
-        spec = create_conversational_agent(base_name, system_prompt)
-    elif agent_type == "insights":
-        spec = create_background_insights_agent(base_name, system_prompt)
-    else:
-        spec = create_reflector_agent(base_name, system_prompt)
+    spec = create_spec(base_name, system_prompt)
 
     # Handle archive and shared blocks based on agent type
     archive_id: str | None = None
@@ -487,8 +715,11 @@ async def _run_provisioning(
         archive_id = await find_or_create_archive(client, base_name, existing_archives)
     else:
         # For subsidiary agents: find and attach the conversational agent's archive and blocks
-        logger.info("Looking for conversational agent's archive...")
-        archive_id = await find_conversational_agent_archive(client, base_name)
+        logger.info("Looking for conversational agent's archive and shared blocks...")
+        shared_labels = {b.label for b in spec.shared_blocks}
+        archive_id, shared_block_ids = await _lookup_conversational_agent_deps(
+            client, base_name, shared_labels
+        )
         if not archive_id:
             logger.error(
                 "Cannot provision %s agent: conversational agent '%s' not found "
@@ -498,12 +729,6 @@ async def _run_provisioning(
             )
             return 1
 
-        # Get the shared block IDs from the conversational agent
-        logger.info("Looking for conversational agent's shared blocks...")
-        shared_labels = {b.label for b in spec.shared_blocks}
-        shared_block_ids = await get_conversational_agent_shared_blocks(
-            client, base_name, shared_labels
-        )
         if not shared_block_ids:
             logger.error(
                 "Cannot provision %s agent: conversational agent '%s' has no shared blocks.",
@@ -547,38 +772,28 @@ async def _attach_block_to_conversational_agent(
         block_label: Label of the block to attach.
     """
     # Find the block on the source agent
-    block_id: str | None = None
-    async for block in client.agents.blocks.list(agent_id=source_agent_id):
-        if block.label == block_label:
-            block_id = block.id
-            break
+    block_id = (await _blocks_map(client, source_agent_id)).get(block_label)
 
     if not block_id:
         logger.warning("  Block '%s' not found on agent %s", block_label, source_agent_id)
         return
 
-    # Find the conversational agent and check for existing block with same label
-    conv_agent_id: str | None = None
-    existing_block_id: str | None = None
-    async for agent in client.agents.list(name=base_name):
-        if agent.name == base_name:
-            conv_agent_id = agent.id
-            # Check if conversational agent already has a block with this label
-            async for existing_block in client.agents.blocks.list(agent_id=agent.id):
-                if existing_block.label == block_label:
-                    existing_block_id = existing_block.id
-                    break
-            break
-
+    # Find the conversational agent
+    conv_agent_id = await _find_agent_id(client, base_name)
     if not conv_agent_id:
         logger.warning("  Conversational agent '%s' not found", base_name)
         return
 
+    # Check if conversational agent already has a block with this label
+    existing_block_id = (await _blocks_map(client, conv_agent_id)).get(block_label)
+
     # Check if the correct block is already attached
     if existing_block_id == block_id:
         logger.info("  Block '%s' (%s) already correctly attached to conversational agent", block_label, block_id)
         return
 
+    _agent_blocks.pop(conv_agent_id, None)
+
     # If a different block with the same label exists, detach it first
     if existing_block_id:
         logger.info("  Detaching incorrect block '%s' (%s) from conversational agent", block_label, existing_block_id)
@@ -625,32 +840,46 @@ async def main() -> int:
 
     args = parser.parse_args()
 
-    client = AsyncLetta(base_url=args.letta_url)
+    if not (args.list_blocks or args.list_agents or args.list_archives):
+        if not args.type:
+            parser.error("--type is required when provisioning an agent")
+
+        if not args.name:
+            parser.error("--name is required when provisioning an agent")
 
-    if args.list_blocks:
-        await list_blocks(client)
-        return 0
+    # One client (and connection pool) for every call made during this run
+    async with AsyncLetta(base_url=args.letta_url) as client:
+        if args.list_blocks:
+            await list_blocks(client)
+            return 0
 
-    if args.list_agents:
-        await list_agents(client)
-        return 0
+        if args.list_agents:
+            await list_agents(client)
+            return 0
 
-    if args.list_archives:
-        await list_archives(client)
-        return 0
+        if args.list_archives:
+            await list_archives(client)
+            return 0
 
-    if not args.type:
-        parser.error("--type is required when provisioning an agent")
+        return await _run_provisioning(client, args.type, args.name)
 
-    if not args.name:
-        parser.error("--name is required when provisioning an agent")
 
-    return await _run_provisioning(client, args.type, args.name)
+async def _main_and_close() -> int:
+    """Run the CLI, then release database connections before the loop closes."""
+    try:
+        return await main()
+    finally:
+        await close_engine()
 
 
 def cli() -> None:
     """Entry point for the CLI."""
-    sys.exit(asyncio.run(main()))
+    # uvloop comes with uvicorn[standard] but isn't available on every platform
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        sys.exit(asyncio.run(_main_and_close()))
+    sys.exit(asyncio.run(_main_and_close(), loop_factory=uvloop.new_event_loop))
 
 
 if __name__ == "__main__":
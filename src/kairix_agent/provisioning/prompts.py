@@ -1,6 +1,8 @@
 """System prompt loader from database."""
 
+import asyncio
 import logging
+import time
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -11,9 +13,31 @@ from kairix_agent.provisioning.models import AgentDefinition
 logger = logging.getLogger(__name__)
 
 # Async engine and session factory (lazy initialized)
-_engine = create_async_engine(Config.DATABASE_URL.value, echo=False)
+_engine = create_async_engine(
+    Config.DATABASE_URL.value,
+    echo=False,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 _async_session = async_sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
 
+# Prompts change rarely - serve repeat lookups from memory for a short while
+PROMPT_CACHE_TTL_SECONDS = 60.0
+
+# Module-level cache keyed by agent_type: (loaded_at, system_prompt)
+_prompt_cache: dict[str, tuple[float, str]] = {}
+_prompt_lock = asyncio.Lock()
+
+
+def _cached_prompt(agent_type: str) -> str | None:
+    """Return the cached prompt for an agent type if it has not expired."""
+    cached = _prompt_cache.get(agent_type)
+    if cached is not None and time.monotonic() - cached[0] < PROMPT_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
 
 async def get_system_prompt(agent_type: str) -> str:
     """Load system prompt from database by agent type.
@@ -27,15 +51,32 @@ async def get_system_prompt(agent_type: str) -> str:
     Raises:
         ValueError: If no prompt config exists for the given agent type.
     """
-    async with _async_session() as session:
-        result = await session.execute(
-            select(AgentDefinition).where(AgentDefinition.agent_type == agent_type)
-        )
-        config = result.scalar_one_or_none()
+    # Check cache first (no lock needed for read)
+    prompt = _cached_prompt(agent_type)
+    if prompt is not None:
+        return prompt
+
+    async with _prompt_lock:
+        # Double-check after acquiring lock
+        prompt = _cached_prompt(agent_type)
+        if prompt is not None:
+            return prompt
+
+        async with _async_session() as session:
+            result = await session.execute(
+                select(AgentDefinition).where(AgentDefinition.agent_type == agent_type)
+            )
+            config = result.scalar_one_or_none()
 
         if config is None:
             msg = f"No prompt config for agent_type: {agent_type}"
             raise ValueError(msg)
 
         logger.debug("Loaded system prompt for %s (%d chars)", agent_type, len(config.system_prompt))
-        return config.system_prompt
\ No newline at end of file
+        _prompt_cache[agent_type] = (time.monotonic(), config.system_prompt)
+        return config.system_prompt
+
+
+async def close_engine() -> None:
+    """Dispose of the prompt loader's connection pool."""
+    await _engine.dispose()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 
+from kairix_agent.worker.background import drain_background_tasks
 from kairix_agent.worker.jobs.insights import check_insights_relevance
 from kairix_agent.worker.settings import MONITORED_AGENTS
 
@@ -16,6 +17,7 @@ async def _run() -> None:
         None,  # type: ignore[arg-type]
         agents=MONITORED_AGENTS,
     )
+    await drain_background_tasks()
     print(f"\nResult: {result}")  # noqa: T201
 
 
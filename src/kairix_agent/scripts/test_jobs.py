@@ -12,6 +12,7 @@ from letta_client import AsyncLetta
 
 from kairix_agent.agent_config import get_agent_config
 from kairix_agent.config import Config
+from kairix_agent.worker.background import drain_background_tasks
 from kairix_agent.worker.jobs.insights import _check_agent_insights
 from kairix_agent.worker.jobs.summarize import summarize_session
 
@@ -38,6 +39,7 @@ async def _run_insights(agent_id: str, letta_url: str) -> dict[str, Any]:
         agent_id=agent_id,
         insights_agent_id=config.insights_agent_id,
     )
+    await drain_background_tasks()
 
     logger.info("Result: %s", result)
     return result
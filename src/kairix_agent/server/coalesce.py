@@ -0,0 +1,58 @@
+"""Batching of streamed response chunks for the /ws endpoint."""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+
+# Stream chunks joined into one /ws message: flushed at this many chunks or after this delay
+CHUNK_BATCH_MAX = 8
+CHUNK_BATCH_DELAY_SECONDS = 0.025
+
+
+async def coalesce_chunks(chunks: AsyncIterator[str]) -> AsyncGenerator[str, None]:
+    """Join adjacent stream chunks so each send carries several tokens.
+
+    A batch is flushed once it holds CHUNK_BATCH_MAX chunks, or when
+    CHUNK_BATCH_DELAY_SECONDS pass after its first chunk, even if the
+    stream goes quiet. Closing this generator early also closes the source.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = aiter(chunks)
+    batch: list[str] = []
+    deadline = 0.0
+    pending: asyncio.Future[str] | None = None
+    try:
+        while True:
+            if pending is None:
+                # Awaited through a future so a flush timeout doesn't cancel the stream
+                pending = asyncio.ensure_future(anext(iterator))
+            timeout = max(deadline - loop.time(), 0.0) if batch else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield "".join(batch)
+                batch.clear()
+                continue
+
+            next_chunk, pending = pending, None
+            try:
+                chunk = next_chunk.result()
+            except StopAsyncIteration:
+                break
+            if not batch:
+                deadline = loop.time() + CHUNK_BATCH_DELAY_SECONDS
+            batch.append(chunk)
+            if len(batch) >= CHUNK_BATCH_MAX:
+                yield "".join(batch)
+                batch.clear()
+
+        if batch:
+            yield "".join(batch)
+    finally:
+        if pending is not None:
+            # The source can't be closed while a read is still running on it
+            pending.cancel()
+            await asyncio.wait({pending})
+        # Release the source now (e.g. the Letta stream when a client disconnects)
+        # rather than whenever it is garbage collected
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -1,65 +1,154 @@
 """WebSocket connection manager for event streaming."""
 
 import asyncio
-import json
+import contextlib
 import logging
-from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
-from fastapi import WebSocket
+import orjson
+from fastapi import WebSocket, status
 
 logger = logging.getLogger(__name__)
 
+# Events buffered per client before it is considered too slow and disconnected
+OUTBOUND_QUEUE_SIZE = 256
+
+# Clients kept per agent; registering beyond this closes the oldest one
+MAX_PER_AGENT = 64
+
+# Seconds a single send may take before the client is treated as stalled
+SEND_TIMEOUT_SECONDS = 2.0
+
+
+@dataclass(slots=True)
+class _Client:
+    """Outbound state for one connected client."""
+
+    queue: asyncio.Queue[str]
+    writer: asyncio.Task[None]
+
 
 class ConnectionManager:
     """Manages WebSocket connections for agent event streams.
 
     Tracks active connections per agent_id and dispatches events
-    to all connected clients for a given agent.
+    to all connected clients for a given agent. Each client gets its
+    own bounded queue drained by a writer task, so dispatching never
+    waits on a slow receiver.
     """
 
     def __init__(self) -> None:
-        self._connections: dict[str, set[WebSocket]] = defaultdict(set)
+        # Per-agent client maps are copy-on-write: register/unregister swap in a new
+        # dict under the lock, so dispatch can read a snapshot without locking
+        self._connections: dict[str, dict[WebSocket, _Client]] = {}
         self._lock = asyncio.Lock()
+        # Keeps close tasks for dropped clients alive until they finish
+        self._closing: set[asyncio.Task[None]] = set()
+        # Awaited (under the lock) when an agent gains its first client or loses its last one
+        self.on_agent_connected: Callable[[str], Awaitable[None]] | None = None
+        self.on_agent_disconnected: Callable[[str], Awaitable[None]] | None = None
+
+    def agent_ids(self) -> list[str]:
+        """Get the IDs of all agents that currently have connected clients."""
+        return list(self._connections)
 
     async def register(self, agent_id: str, websocket: WebSocket) -> None:
         """Register a WebSocket connection for an agent."""
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        writer = asyncio.create_task(self._writer(websocket, queue))
         async with self._lock:
-            self._connections[agent_id].add(websocket)
+            first = agent_id not in self._connections
+            clients = dict(self._connections.get(agent_id, {}))
+            if len(clients) >= MAX_PER_AGENT:
+                # Dicts keep insertion order, so the first entry is the oldest client
+                oldest = next(iter(clients))
+                logger.warning("Too many event connections for agent %s, closing the oldest", agent_id)
+                clients.pop(oldest).writer.cancel()
+                self._drop(oldest)
+            clients[websocket] = _Client(queue=queue, writer=writer)
+            self._connections[agent_id] = clients
+            if first:
+                await self._notify(self.on_agent_connected, agent_id)
             logger.info(
                 "Registered event connection for agent %s (total: %d)",
                 agent_id,
-                len(self._connections[agent_id]),
+                len(clients),
             )
 
     async def unregister(self, agent_id: str, websocket: WebSocket) -> None:
         """Unregister a WebSocket connection for an agent."""
         async with self._lock:
-            self._connections[agent_id].discard(websocket)
-            if not self._connections[agent_id]:
-                del self._connections[agent_id]
-            logger.info("Unregistered event connection for agent %s", agent_id)
+            clients = dict(self._connections.get(agent_id, {}))
+            client = clients.pop(websocket, None)
+            if clients:
+                self._connections[agent_id] = clients
+            elif self._connections.pop(agent_id, None) is not None:
+                await self._notify(self.on_agent_disconnected, agent_id)
+        if client is not None:
+            client.writer.cancel()
+        logger.info("Unregistered event connection for agent %s", agent_id)
 
-    async def dispatch(self, agent_id: str, event_data: dict) -> None:  # type: ignore[type-arg]
-        """Push event to all connected clients for this agent.
+    async def dispatch(self, agent_id: str, event_data: dict | str) -> None:  # type: ignore[type-arg]
+        """Queue event for all connected clients for this agent.
 
         Args:
             agent_id: The agent whose clients should receive the event.
-            event_data: The event payload to send as JSON.
+            event_data: The event payload to send as JSON, or an already
+                serialized JSON event string which is forwarded as-is.
         """
-        async with self._lock:
-            sockets = list(self._connections.get(agent_id, []))
-
-        if not sockets:
+        clients = self._connections.get(agent_id)
+        if not clients:
             logger.debug("No active connections for agent %s, skipping dispatch", agent_id)
             return
 
-        message = json.dumps(event_data)
-        for ws in sockets:
+        # Serialize once for every client; datetimes are encoded natively by orjson.
+        # Clients read text frames, so the bytes are decoded rather than sent as binary.
+        message = event_data if isinstance(event_data, str) else orjson.dumps(event_data).decode()
+
+        for websocket, client in clients.items():
+            try:
+                client.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("Event queue full for a client of agent %s, disconnecting it", agent_id)
+                await self.unregister(agent_id, websocket)
+                self._drop(websocket)
+
+    def _drop(self, websocket: WebSocket) -> None:
+        """Close a client in the background, keeping the task alive until it finishes."""
+        task = asyncio.create_task(self._close(websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _notify(self, hook: Callable[[str], Awaitable[None]] | None, agent_id: str) -> None:
+        """Run a connection hook, logging rather than raising if it fails."""
+        if hook is None:
+            return
+        try:
+            await hook(agent_id)
+        except Exception:
+            logger.exception("Connection hook failed for agent %s", agent_id)
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue[str]) -> None:
+        """Send queued events to one client until it disconnects."""
+        while True:
+            message = await queue.get()
             try:
-                await ws.send_text(message)
+                await asyncio.wait_for(websocket.send_text(message), timeout=SEND_TIMEOUT_SECONDS)
+            except TimeoutError:
+                # Stalled client; closing it makes its handler unregister it
+                logger.warning("Timed out sending event to client, closing it")
+                await self._close(websocket)
+                return
             except Exception:  # noqa: BLE001
-                # Client disconnected, will be cleaned up on next unregister
+                # Client disconnected, will be cleaned up on unregister
                 logger.debug("Failed to send event to client, connection may be closed")
+                return
+
+    async def _close(self, websocket: WebSocket) -> None:
+        """Close a client that could not keep up with its events, or was evicted."""
+        with contextlib.suppress(Exception):
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
 
 
 # Singleton instance
@@ -1,21 +1,70 @@
 """Redis pub/sub listener for agent events."""
 
 import asyncio
+import functools
 import logging
+from typing import TYPE_CHECKING
 
+import asyncpg
+import orjson
 import redis.asyncio as redis
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from asyncpg.prepared_stmt import PreparedStatement
+from sqlalchemy.engine import make_url
 
 from kairix_agent.config import Config
-from kairix_agent.events.models import AgentEvent
 from kairix_agent.server.events.connection_manager import connection_manager
 
+if TYPE_CHECKING:
+    from redis.asyncio.client import PubSub
+
 logger = logging.getLogger(__name__)
 
-# Database session for fetching event details
-_engine = create_async_engine(Config.DATABASE_URL.value, echo=False)
-_async_session = async_sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
+_FETCH_EVENT_SQL = """
+    SELECT id, agent_id, event_type, payload, created_at
+    FROM agent_events
+    WHERE id = $1
+"""
+
+# Config values are fixed for the life of the process
+_REDIS_URL = Config.REDIS_URL.value
+
+# Pub/sub messages buffered between the Redis reader and the dispatcher
+EVENT_QUEUE_SIZE = 1024
+
+
+@functools.cache
+def _raw_postgres_url() -> str:
+    """Get DATABASE_URL as a plain postgresql:// DSN, without SQLAlchemy's driver suffix."""
+    url = make_url(Config.DATABASE_URL.value).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class _EventFetcher:
+    """Dedicated Postgres connection and prepared statement for fetching event details.
+
+    Connects lazily on the first lookup and again whenever the connection is lost.
+    """
+
+    def __init__(self) -> None:
+        self._conn: asyncpg.Connection | None = None
+        self._stmt: PreparedStatement | None = None
+        self._lock = asyncio.Lock()
+
+    async def statement(self) -> PreparedStatement:
+        """Get the prepared event lookup, reconnecting if its connection was lost."""
+        async with self._lock:
+            if self._conn is None or self._stmt is None or self._conn.is_closed():
+                # Lookups can be hours apart; TCP keepalives keep the idle connection
+                # healthy without application-level polling
+                self._conn = await asyncpg.connect(
+                    _raw_postgres_url(),
+                    server_settings={"tcp_keepalives_idle": "60", "tcp_keepalives_interval": "10"},
+                )
+                self._stmt = await self._conn.prepare(_FETCH_EVENT_SQL)
+            return self._stmt
+
+
+_fetcher = _EventFetcher()
 
 
 async def _fetch_event(event_id: str) -> dict | None:  # type: ignore[type-arg]
@@ -28,91 +77,164 @@ async def _fetch_event(event_id: str) -> dict | None:  # type: ignore[type-arg]
         Event data dict or None if not found.
     """
     logger.debug("[fetch] Looking up event %s in database", event_id)
-    async with _async_session() as session:
-        result = await session.execute(
-            select(AgentEvent).where(AgentEvent.id == event_id)
-        )
-        event = result.scalar_one_or_none()
-        if event is None:
-            logger.warning("[fetch] Event %s not found in database", event_id)
-            return None
-        logger.debug("[fetch] Found event %s: type=%s, agent=%s", event_id, event.event_type, event.agent_id)
-        return {
-            "id": event.id,
-            "agent_id": event.agent_id,
-            "event_type": event.event_type,
-            "payload": event.payload,
-            "created_at": event.created_at.isoformat(),
-        }
+    stmt = await _fetcher.statement()
+    row = await stmt.fetchrow(event_id)
+    if row is None:
+        logger.warning("[fetch] Event %s not found in database", event_id)
+        return None
+    logger.debug(
+        "[fetch] Found event %s: type=%s, agent=%s", event_id, row["event_type"], row["agent_id"]
+    )
+    return {
+        "id": str(row["id"]),
+        "agent_id": row["agent_id"],
+        "event_type": row["event_type"],
+        # asyncpg returns JSONB as text unless a codec is registered
+        "payload": orjson.loads(row["payload"]),
+        "created_at": row["created_at"],
+    }
+
+
+async def _dispatch_message(agent_id: str, data: str) -> None:
+    """Resolve one pub/sub message to an event and dispatch it to clients."""
+    event_data: dict | str  # type: ignore[type-arg]
+    if data.startswith("{"):
+        # Message carries the serialized event - forward it without re-encoding
+        logger.info("[listener] Received serialized event (%d chars)", len(data))
+        event_data = data
+    else:
+        # Message carries only the event ID - fetch the full event from Postgres
+        event_id = data
+        logger.info("[listener] Event ID: %s", event_id)
+        logger.info("[listener] Fetching event details from Postgres...")
+        fetched = await _fetch_event(event_id)
+        if fetched is None:
+            logger.error("[listener] Event %s not found in database, skipping", event_id)
+            return
+        logger.info("[listener] Fetched event: type=%s", fetched.get("event_type"))
+        event_data = fetched
+
+    # Dispatch to connected WebSocket clients
+    logger.info("[listener] Dispatching to ConnectionManager for agent %s...", agent_id)
+    await connection_manager.dispatch(agent_id, event_data)
+    logger.info("[listener] Successfully dispatched event for agent %s", agent_id)
+
+
+async def _process_messages(queue: asyncio.Queue[tuple[str, str]]) -> None:
+    """Dispatch queued pub/sub messages one at a time, in arrival order."""
+    while True:
+        agent_id, data = await queue.get()
+        try:
+            await _dispatch_message(agent_id, data)
+        except Exception:
+            logger.exception("[listener] Error processing Redis message")
+
+
+def _agent_channel(agent_id: str) -> str:
+    """Get the Redis channel an agent's events are published on."""
+    return f"agent_events:{agent_id}"
+
+
+class _Subscriptions:
+    """Pub/sub subscription state, following the ConnectionManager's agents."""
+
+    def __init__(self) -> None:
+        # Subscription for the current Redis connection, None while disconnected
+        self.pubsub: PubSub | None = None
+        # Agent each watched channel belongs to; only agents with connected clients
+        self._channel_agents: dict[str, str] = {}
+
+    def agent_for(self, channel: str) -> str | None:
+        """Get the agent a channel belongs to, or None if it is not watched."""
+        return self._channel_agents.get(channel)
+
+    def watch(self, agent_id: str) -> str:
+        """Record an agent's channel as watched and return it."""
+        channel = _agent_channel(agent_id)
+        self._channel_agents[channel] = agent_id
+        return channel
+
+    async def subscribe_agent(self, agent_id: str) -> None:
+        """Start receiving an agent's events once it has a connected client."""
+        channel = self.watch(agent_id)
+        if self.pubsub is not None:
+            await self.pubsub.subscribe(channel)
+            logger.info("[listener] Subscribed to events for agent %s", agent_id)
+
+    async def unsubscribe_agent(self, agent_id: str) -> None:
+        """Stop receiving an agent's events once its last client disconnects."""
+        channel = _agent_channel(agent_id)
+        self._channel_agents.pop(channel, None)
+        if self.pubsub is not None:
+            await self.pubsub.unsubscribe(channel)
+            logger.info("[listener] Unsubscribed from events for agent %s", agent_id)
+
+
+_subscriptions = _Subscriptions()
 
 
 async def start_event_listener() -> None:
     """Start the Redis pub/sub listener for agent events.
 
     This is a long-running task that should be started on server startup.
-    It subscribes to the 'agent_events:*' pattern and dispatches events
-    to connected WebSocket clients via the ConnectionManager.
+    It subscribes to the 'agent_events:{agent_id}' channel of each agent
+    with connected WebSocket clients, following the ConnectionManager as
+    clients come and go, and dispatches events to those clients. Reading
+    from Redis only enqueues messages; a separate task fetches and
+    dispatches them, so a slow database lookup never stalls the subscription.
     """
     logger.info("[listener] Starting Redis event listener...")
-    logger.info("[listener] Redis URL: %s", Config.REDIS_URL.value)
-
-    while True:
-        try:
-            logger.info("[listener] Connecting to Redis...")
-            r = redis.from_url(Config.REDIS_URL.value)
-            pubsub = r.pubsub()
-
-            # Subscribe to pattern: agent_events:{agent_id}
-            await pubsub.psubscribe("agent_events:*")
-            logger.info("[listener] Subscribed to 'agent_events:*' pattern, waiting for messages...")
-
-            async for message in pubsub.listen():
-                logger.debug("[listener] Received raw message: type=%s", message.get("type"))
-
-                if message["type"] != "pmessage":
-                    logger.debug("[listener] Skipping non-pmessage: %s", message.get("type"))
-                    continue
+    logger.info("[listener] Redis URL: %s", _REDIS_URL)
+
+    connection_manager.on_agent_connected = _subscriptions.subscribe_agent
+    connection_manager.on_agent_disconnected = _subscriptions.unsubscribe_agent
+
+    queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    processor = asyncio.create_task(_process_messages(queue))
+
+    try:
+        while True:
+            try:
+                logger.info("[listener] Connecting to Redis...")
+                # The subscription sits idle between events, so rely on TCP keepalive
+                # to surface a dead connection rather than polling Redis
+                r = redis.from_url(_REDIS_URL, socket_keepalive=True, decode_responses=True)
+                pubsub = r.pubsub()
+                await pubsub.connect()
+                _subscriptions.pubsub = pubsub
+
+                # Catch up on agents whose clients connected before this connection
+                if agent_ids := connection_manager.agent_ids():
+                    await pubsub.subscribe(*(_subscriptions.watch(a) for a in agent_ids))
+                logger.info(
+                    "[listener] Subscribed to %d agent channels, waiting for messages...",
+                    len(agent_ids),
+                )
+
+                while True:
+                    # Blocks until a message arrives; subscribe acks are filtered out by redis-py
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                    if message is None:
+                        continue
 
-                try:
-                    # Extract channel and decode if bytes
                     channel = message["channel"]
-                    if isinstance(channel, bytes):
-                        channel = channel.decode("utf-8")
                     logger.info("[listener] Message on channel: %s", channel)
 
-                    # Extract agent_id from channel name
-                    agent_id = channel.replace("agent_events:", "")
-                    logger.info("[listener] Extracted agent_id: %s", agent_id)
-
-                    # Get event ID from message data
-                    event_id = message["data"]
-                    if isinstance(event_id, bytes):
-                        event_id = event_id.decode("utf-8")
-                    logger.info("[listener] Event ID: %s", event_id)
-
-                    # Fetch full event from Postgres
-                    logger.info("[listener] Fetching event details from Postgres...")
-                    event_data = await _fetch_event(event_id)
-                    if event_data is None:
-                        logger.error("[listener] Event %s not found in database, skipping", event_id)
+                    agent_id = _subscriptions.agent_for(channel)
+                    if agent_id is None:
                         continue
-                    logger.info("[listener] Fetched event: type=%s", event_data.get("event_type"))
-
-                    # Dispatch to connected WebSocket clients
-                    logger.info("[listener] Dispatching to ConnectionManager for agent %s...", agent_id)
-                    await connection_manager.dispatch(agent_id, event_data)
-                    logger.info(
-                        "[listener] Successfully dispatched %s event for agent %s",
-                        event_data.get("event_type"),
-                        agent_id,
-                    )
-
-                except Exception:
-                    logger.exception("[listener] Error processing Redis message")
-
-        except asyncio.CancelledError:
-            logger.info("[listener] Shutting down (cancelled)")
-            raise
-        except Exception:
-            logger.exception("[listener] Connection error, reconnecting in 5s...")
-            await asyncio.sleep(5)
\ No newline at end of file
+
+                    # Waits when the processor falls behind, applying backpressure to Redis reads
+                    await queue.put((agent_id, message["data"]))
+
+            except asyncio.CancelledError:
+                logger.info("[listener] Shutting down (cancelled)")
+                raise
+            except Exception:
+                logger.exception("[listener] Connection error, reconnecting in 5s...")
+                await asyncio.sleep(5)
+    finally:
+        _subscriptions.pubsub = None
+        connection_manager.on_agent_connected = None
+        connection_manager.on_agent_disconnected = None
+        processor.cancel()
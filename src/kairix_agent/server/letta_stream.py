@@ -0,0 +1,32 @@
+"""Helpers shared by the Letta streaming loops."""
+
+from __future__ import annotations
+
+from logging import DEBUG
+from typing import TYPE_CHECKING, TypeGuard
+
+from rich.pretty import pretty_repr
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from letta_client.types.agents import AssistantMessage, LettaStreamingResponse
+
+
+def log_stream_response(logger: Logger, response: LettaStreamingResponse) -> None:
+    """Log one streamed Letta response at debug level.
+
+    Args:
+        logger: The caller's logger.
+        response: The streamed response.
+    """
+    logger.debug("Got letta response of type %s", response.message_type)
+    # pretty_repr walks the whole response, so only build it when it will be logged
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("Letta response content: \n\n %s \n\n", pretty_repr(response))
+
+
+def is_assistant(response: LettaStreamingResponse) -> TypeGuard[AssistantMessage]:
+    """Check whether a streamed Letta response is assistant text."""
+    # A string compare on the discriminator is cheaper than isinstance on the model
+    return response.message_type == "assistant_message"
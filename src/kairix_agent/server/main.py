@@ -4,11 +4,12 @@ import asyncio
 import logging
 import os
 import uuid
-from contextlib import asynccontextmanager
+from contextlib import aclosing, asynccontextmanager
 from typing import AsyncIterator
 
 import aiohttp
 import dotenv
+import orjson
 import uvicorn
 from deepgram import LiveOptions
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
@@ -30,9 +31,11 @@ from pipecat_whisker import WhiskerObserver
 from saq import Queue
 
 from kairix_agent.config import Config
+from kairix_agent.letta_clients import close_letta_clients
 from kairix_agent.logging_config import setup_logging
+from kairix_agent.server.coalesce import coalesce_chunks
 from kairix_agent.server.events import connection_manager, start_event_listener
-from kairix_agent.server.model import InputChunk, ResponseChunk, ResponseDone, ResponseStart
+from kairix_agent.server.model import InputChunk, ResponseDone, ResponseStart
 from kairix_agent.server.pipecat import LettaLLMService, UserTurnAggregator
 from kairix_agent.server.provider import AnthropicProvider, LettaProvider
 
@@ -58,6 +61,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         pass
     logger.info("Event listener task stopped")
 
+    # Close the shared Letta clients' connection pools
+    await close_letta_clients()
+
 
 app = FastAPI(lifespan=lifespan)
 
@@ -90,27 +96,33 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         while True:
             text = await websocket.receive_text()
             input_chunk = InputChunk.model_validate_json(text)
-            logger.info(f"Received input chunk: {input_chunk.text}")
+            logger.info("Received input chunk: %s", input_chunk.text)
 
             response_id = f"response-{uuid.uuid4()}"
             logger.info("Sending response start")
-            response_start = ResponseStart(id=response_id, timestamp=1)
+            # Server-authored messages skip validation; every field is set here
+            response_start = ResponseStart.model_construct(id=response_id, timestamp=1.0)
             await websocket.send_text(response_start.model_dump_json())
 
             chunk_cnt = 0
-            async for chunk in letta_provider.stream_response(user_message=input_chunk.text):
-                logger.info(f"Received chunk {chunk_cnt}. Content: {chunk}")
-                response_chunk = ResponseChunk(
-                    chunk_id=f"chunk-{chunk_cnt}",
-                    response_id=response_id,
-                    timestamp=2,
-                    text=chunk,
-                )
-                await websocket.send_text(response_chunk.model_dump_json())
-                chunk_cnt += 1
+            stream = letta_provider.stream_response(user_message=input_chunk.text)
+            async with aclosing(coalesce_chunks(stream)) as batches:
+                async for chunk in batches:
+                    logger.debug("Received chunk %d. Content: %s", chunk_cnt, chunk)
+                    # Per-token hot path: encode the ResponseChunk fields directly rather
+                    # than building and serializing a model for every chunk
+                    response_chunk = {
+                        "chunk_id": f"chunk-{chunk_cnt}",
+                        "response_id": response_id,
+                        "text": chunk,
+                        "timestamp": 2.0,
+                        "type": "response_chunk",
+                    }
+                    await websocket.send_text(orjson.dumps(response_chunk).decode())
+                    chunk_cnt += 1
 
             logger.info("Sending response end")
-            response_done = ResponseDone(id=response_id, timestamp=3)
+            response_done = ResponseDone.model_construct(id=response_id, timestamp=3.0)
             await websocket.send_text(response_done.model_dump_json())
     except WebSocketDisconnect:
         logger.info("Disconnected from websocket")
@@ -229,6 +241,13 @@ def main() -> None:
     uvicorn_kwargs: dict[str, object] = {
         "host": "0.0.0.0",
         "port": 8000,
+        # uvloop and httptools come with uvicorn[standard]; pin them rather than relying on "auto"
+        "loop": "uvloop",
+        "http": "httptools",
+        "ws": "websockets",
+        # Audio frames and short JSON events gain little from compression but pay for it on every message
+        "ws_per_message_deflate": False,
+        "timeout_keep_alive": 30,
     }
 
     if reload_enabled:
@@ -8,8 +8,6 @@ from __future__ import annotations
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from letta_client import AsyncLetta, AsyncStream
-from letta_client.types.agents import AssistantMessage, LettaStreamingResponse
 from pipecat.frames.frames import (
     Frame,
     LLMFullResponseEndFrame,
@@ -18,17 +16,24 @@ from pipecat.frames.frames import (
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.utils.text.markdown_text_filter import MarkdownTextFilter
-from rich.pretty import pretty_repr
 
 from kairix_agent.config import Config
+from kairix_agent.letta_clients import get_letta_client
+from kairix_agent.server.letta_stream import is_assistant, log_stream_response
 from kairix_agent.server.pipecat.user_turn_aggregator import UserTurnMessageFrame
 from kairix_agent.worker.jobs import TRIGGER_INSIGHTS_JOB
 
 if TYPE_CHECKING:
+    from letta_client import AsyncLetta, AsyncStream
+    from letta_client.types.agents import LettaStreamingResponse
     from saq import Queue
 
 logger = getLogger(__name__)
 
+# Streamed text is filtered and pushed once it reaches a sentence boundary or this length
+TEXT_FLUSH_CHARS = 120
+_SENTENCE_ENDINGS = (".", "?", "!", "\n")
+
 
 class LettaLLMService(FrameProcessor):
     """Pipecat LLM service that uses Letta as the backend.
@@ -51,6 +56,7 @@ class LettaLLMService(FrameProcessor):
         base_url: str | None = None,
         name: str | None = None,
         queue: Queue | None = None,
+        client: AsyncLetta | None = None,
     ) -> None:
         """Initialize the Letta LLM service.
 
@@ -59,12 +65,13 @@ class LettaLLMService(FrameProcessor):
             base_url: The Letta server URL (defaults to LETTA_BASE_URL env var).
             name: Optional name for this processor (for logging/debugging).
             queue: Optional SAQ queue for enqueuing background jobs.
+            client: Optional Letta client (defaults to the shared client for base_url).
         """
         super().__init__(name=name)
         if base_url is None:
             base_url = Config.LETTA_BASE_URL.value
         self._base_url = base_url
-        self._client = AsyncLetta(base_url=base_url)
+        self._client = client or get_letta_client(base_url)
         self._agent_id = agent_id
         self._filter = MarkdownTextFilter()
         self._queue = queue
@@ -101,19 +108,24 @@ class LettaLLMService(FrameProcessor):
             agent_id=self._agent_id, input=user_message, streaming=True, stream_tokens=True
         )
 
+        # Tokens are buffered so the markdown filter runs once per sentence, not per token
+        pending_text = ""
         async for response in response_stream:
-            pretty_response = pretty_repr(response)
-            logger.info(
-                "Got letta response of type %s, with content: \n\n %s \n\n",
-                response.message_type,
-                pretty_response,
-            )
-            if isinstance(response, AssistantMessage):
-                if not isinstance(response.content, str):
-                    logger.info("Unexpected content type for response: %s", type(response.content))
+            log_stream_response(logger, response)
+            if is_assistant(response):
+                content = response.content
+                if not isinstance(content, str):
+                    logger.info("Unexpected content type for response: %s", type(content))
                 else:
-                    filtered_text = await self._filter.filter(response.content)
-                    await self.push_frame(TextFrame(text=filtered_text))
+                    pending_text += content
+                    if (
+                        pending_text.rstrip(" ").endswith(_SENTENCE_ENDINGS)
+                        or len(pending_text) >= TEXT_FLUSH_CHARS
+                    ):
+                        await self._push_text(pending_text)
+                        pending_text = ""
+
+        await self._push_text(pending_text)
 
         # Signal response is complete
         await self.push_frame(LLMFullResponseEndFrame())
@@ -121,6 +133,13 @@ class LettaLLMService(FrameProcessor):
         # Enqueue background insights job
         await self._enqueue_insights()
 
+    async def _push_text(self, text: str) -> None:
+        """Strip markdown from buffered response text and push it downstream."""
+        if not text:
+            return
+        filtered_text = await self._filter.filter(text)
+        await self.push_frame(TextFrame(text=filtered_text))
+
     async def _enqueue_insights(self) -> None:
         """Enqueue an insights reflection job after LLM response."""
         if self._queue is None:
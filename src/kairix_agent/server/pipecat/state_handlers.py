@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pipecat.frames.frames import (
     Frame,
@@ -20,16 +20,37 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameDirection
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from kairix_agent.server.pipecat.user_turn_aggregator import UserTurnAggregator, UserTurnState
 
 logger = getLogger(__name__)
 
 
+# Frame classes with a dedicated handler method, in the order they are matched
+_FRAME_METHODS: dict[type[Frame], str] = {
+    UserStartedSpeakingFrame: "on_user_started",
+    InterimTranscriptionFrame: "on_interim_transcription",
+    TranscriptionFrame: "on_transcription",
+    UserStoppedSpeakingFrame: "on_user_stopped",
+}
+
+
+def _method_for(frame_type: type[Frame]) -> str:
+    """Name of the handler method for a frame class, matching subclasses too."""
+    for frame_class, method in _FRAME_METHODS.items():
+        if issubclass(frame_type, frame_class):
+            return method
+    return "on_other"
+
+
 class StateHandler(ABC):
     """Base class for state handlers."""
 
     def __init__(self, aggregator: UserTurnAggregator) -> None:
         self.aggregator = aggregator
+        # Bound handler per concrete frame class, filled in on first sight of each class
+        self._dispatch: dict[type[Frame], Callable[[Any, FrameDirection], Awaitable[None]]] = {}
 
     @property
     @abstractmethod
@@ -38,17 +59,17 @@ class StateHandler(ABC):
         ...
 
     async def handle(self, frame: Frame, direction: FrameDirection) -> None:
-        """Route frame to appropriate handler method."""
-        if isinstance(frame, UserStartedSpeakingFrame):
-            await self.on_user_started(frame, direction)
-        elif isinstance(frame, InterimTranscriptionFrame):
-            await self.on_interim_transcription(frame, direction)
-        elif isinstance(frame, TranscriptionFrame):
-            await self.on_transcription(frame, direction)
-        elif isinstance(frame, UserStoppedSpeakingFrame):
-            await self.on_user_stopped(frame, direction)
-        else:
-            await self.on_other(frame, direction)
+        """Route frame to appropriate handler method.
+
+        One dict lookup on the frame's class replaces an isinstance chain; the
+        chain only runs the first time each class is seen.
+        """
+        frame_type = type(frame)
+        method = self._dispatch.get(frame_type)
+        if method is None:
+            method = getattr(self, _method_for(frame_type))
+            self._dispatch[frame_type] = method
+        await method(frame, direction)
 
     async def on_user_started(
         self, frame: UserStartedSpeakingFrame, direction: FrameDirection
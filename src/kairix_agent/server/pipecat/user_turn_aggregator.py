@@ -34,6 +34,8 @@ from pipecat.frames.frames import Frame
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from kairix_agent.server.pipecat.state_handlers import StateHandler
 
 logger = getLogger(__name__)
@@ -81,6 +83,7 @@ class UserTurnAggregator(FrameProcessor):
         *,
         aggregation_timeout: float = 0.5,
         name: str | None = None,
+        time_source: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize the user turn aggregator.
 
@@ -88,9 +91,12 @@ class UserTurnAggregator(FrameProcessor):
             aggregation_timeout: Seconds to wait for final transcript after
                 UserStoppedSpeakingFrame if we've seen interim results.
             name: Optional name for this processor.
+            time_source: Monotonic clock used for the timeout; tests can
+                inject a fake one.
         """
         super().__init__(name=name)
         self._aggregation_timeout = aggregation_timeout
+        self._now = time_source
         self._handlers = self._create_handlers()
         self.reset_state()
 
@@ -117,10 +123,16 @@ class UserTurnAggregator(FrameProcessor):
     def reset_state(self) -> None:
         """Reset to initial idle state."""
         self._state = UserTurnState.IDLE
-        self._aggregation = ""
+        # Transcript pieces, joined only when the turn is pushed
+        self._aggregation_parts: list[str] = []
         self._pending_interim = False
         self._done_received_at: float | None = None
 
+    @property
+    def _aggregation(self) -> str:
+        """The text aggregated so far this turn."""
+        return "".join(self._aggregation_parts)
+
     def transition_to(self, state: UserTurnState) -> None:
         """Transition to a new state."""
         logger.debug("State transition: %s → %s", self._state.value, state.value)
@@ -128,7 +140,7 @@ class UserTurnAggregator(FrameProcessor):
 
     def append_text(self, text: str) -> None:
         """Append text to the aggregation buffer."""
-        self._aggregation += text
+        self._aggregation_parts.append(text)
 
     def set_pending_interim(self, *, pending: bool) -> None:
         """Set whether we're expecting a final transcript."""
@@ -140,13 +152,14 @@ class UserTurnAggregator(FrameProcessor):
 
     def mark_done_received(self) -> None:
         """Mark the timestamp when user stopped speaking."""
-        self._done_received_at = time.monotonic()
+        self._done_received_at = self._now()
 
     async def push_turn_message(self) -> None:
         """Push the aggregated turn message and reset state."""
-        if self._aggregation:
-            logger.info("Pushing UserTurnMessageFrame: %r", self._aggregation)
-            await self.push_frame(UserTurnMessageFrame(text=self._aggregation))
+        text = self._aggregation
+        if text:
+            logger.info("Pushing UserTurnMessageFrame: %r", text)
+            await self.push_frame(UserTurnMessageFrame(text=text))
         else:
             logger.debug("No aggregation to push, skipping")
         self.reset_state()
@@ -181,7 +194,7 @@ class UserTurnAggregator(FrameProcessor):
         """Check if timeout has expired in DONE_AWAITING_TRANSCRIPT state."""
         if self._done_received_at is None:
             return
-        elapsed = time.monotonic() - self._done_received_at
+        elapsed = self._now() - self._done_received_at
         if elapsed >= self._aggregation_timeout:
             logger.warning(
                 "Timeout waiting for final transcript after %.2fs, pushing partial: %r",
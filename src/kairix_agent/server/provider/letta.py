@@ -2,24 +2,30 @@
 
 from collections.abc import AsyncIterator
 from logging import getLogger
+from typing import TYPE_CHECKING
 
 from letta_client import AsyncLetta, AsyncStream
-from letta_client.types.agents import AssistantMessage, LettaStreamingResponse
-from rich.pretty import pretty_repr
 
-from kairix_agent.config import Config
+from kairix_agent.letta_clients import get_letta_client
+from kairix_agent.server.letta_stream import is_assistant, log_stream_response
 from kairix_agent.server.provider.base import LLMProvider
 
+if TYPE_CHECKING:
+    from letta_client.types.agents import LettaStreamingResponse
+
 logger = getLogger()
 
 
 class LettaProvider(LLMProvider):
     """Letta agent streaming provider."""
 
-    def __init__(self, agent_id: str, base_url: str | None = None) -> None:
-        if base_url is None:
-            base_url = Config.LETTA_BASE_URL.value
-        self.client = AsyncLetta(base_url=base_url)
+    def __init__(
+        self,
+        agent_id: str,
+        base_url: str | None = None,
+        client: AsyncLetta | None = None,
+    ) -> None:
+        self.client = client or get_letta_client(base_url)
         self.agent_id = agent_id
 
     async def stream_response(self, user_message: str) -> AsyncIterator[str]:
@@ -30,11 +36,6 @@ class LettaProvider(LLMProvider):
         )
 
         async for response in response_stream:
-            pretty_response = pretty_repr(response)
-            logger.info(
-                "Got letta response of type %s, with content: \n\n %s \n\n",
-                response.message_type,
-                pretty_response,
-            )
-            if isinstance(response, AssistantMessage):
+            log_stream_response(logger, response)
+            if is_assistant(response):
                 yield response.content  # type: ignore
@@ -1,13 +1,34 @@
 """Resampling VAD wrapper for sample rate mismatch."""
 
 import logging
+import time
+from math import gcd
 
 import numpy as np
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
+from scipy.signal import firwin, resample_poly
 
 logger = logging.getLogger(__name__)
 
+# Silero's native sample rate
+SILERO_SAMPLE_RATE = 16000
+
+# Kaiser window used to design the anti-aliasing filter (scipy's resample_poly default)
+RESAMPLE_WINDOW = ("kaiser", 5.0)
+
+# How often Silero's recurrent state is reset (matches SileroVADAnalyzer)
+MODEL_RESET_SECONDS = 5.0
+
+# Energy gate: frames quieter than NOISE_GATE_MARGIN x the tracked noise floor skip Silero
+INITIAL_NOISE_FLOOR = 1e-4
+NOISE_GATE_MARGIN = 3.0
+NOISE_FLOOR_ALPHA = 0.01
+
+# Frames Silero scores below this are treated as noise too, so the floor can rise
+# to a loud room's level instead of only ever learning from frames the gate rejects
+NOISE_CONFIDENCE_MAX = 0.2
+
 
 class ResamplingVADAnalyzer(SileroVADAnalyzer):
     """Silero VAD with automatic resampling from any input rate to 16kHz."""
@@ -20,15 +41,37 @@ class ResamplingVADAnalyzer(SileroVADAnalyzer):
             params: VAD parameters for detection thresholds and timing.
         """
         # Initialize Silero at 16kHz (its native rate)
-        super().__init__(sample_rate=16000, params=params)
+        super().__init__(sample_rate=SILERO_SAMPLE_RATE, params=params)
         self._input_sample_rate = input_sample_rate
+        # Scratch buffer for the float copy of each frame, reused across calls
+        self._frame_buf = np.empty(0, dtype=np.float32)
+        # Running RMS (relative to full scale) of frames the energy gate treats as silence
+        self._noise_floor = INITIAL_NOISE_FLOOR
+        self._design_resampler()
 
     def set_sample_rate(self, sample_rate: int):
         """Override to capture input rate but keep Silero at 16kHz."""
         self._input_sample_rate = sample_rate
+        self._design_resampler()
         # Call parent with 16kHz to set up internal state properly
         # This sets _sample_rate=16000 and initializes _vad_frames_num_bytes etc.
-        super().set_sample_rate(16000)
+        super().set_sample_rate(SILERO_SAMPLE_RATE)
+
+    def _design_resampler(self) -> None:
+        """Compute the polyphase ratio and anti-aliasing filter for the input rate.
+
+        The filter matches the one resample_poly would design on every call, so
+        it is built once here and passed in as the window.
+        """
+        if self._input_sample_rate == SILERO_SAMPLE_RATE:
+            return
+        divisor = gcd(SILERO_SAMPLE_RATE, self._input_sample_rate)
+        self._up = SILERO_SAMPLE_RATE // divisor
+        self._down = self._input_sample_rate // divisor
+        max_rate = max(self._up, self._down)
+        half_len = 10 * max_rate
+        taps = firwin(2 * half_len + 1, 1 / max_rate, window=RESAMPLE_WINDOW)
+        self._resample_filter = taps.astype(np.float32)
 
     def num_frames_required(self) -> int:
         """Return frame count scaled for input sample rate.
@@ -37,21 +80,68 @@ class ResamplingVADAnalyzer(SileroVADAnalyzer):
         so that after resampling we have the 512 samples Silero expects.
         """
         silero_frames = super().num_frames_required()  # 512 at 16kHz
-        ratio = self._input_sample_rate / 16000
+        ratio = self._input_sample_rate / SILERO_SAMPLE_RATE
         return int(silero_frames * ratio)
 
     def voice_confidence(self, buffer: bytes) -> float:
-        """Resample audio to 16kHz before analyzing."""
-        if self._input_sample_rate == 16000:
-            return super().voice_confidence(buffer)
+        """Resample audio to 16kHz before analyzing.
 
-        # Simple decimation: take every Nth sample (48kHz -> 16kHz = every 3rd)
+        Frames clearly below the noise floor are scored 0.0 without running Silero.
+        """
         audio_int16 = np.frombuffer(buffer, dtype=np.int16)
-        ratio = int(self._input_sample_rate / 16000)
-        resampled = audio_int16[::ratio]
-        resampled_bytes = resampled.tobytes()
-
-        confidence = super().voice_confidence(resampled_bytes)
-        if confidence > 0.3:
-            logger.info("VAD confidence: %.2f (in=%d, out=%d)", confidence, len(audio_int16), len(resampled))
-        return confidence
\ No newline at end of file
+        if self._frame_buf.size != audio_int16.size:
+            self._frame_buf = np.empty(audio_int16.size, dtype=np.float32)
+        np.copyto(self._frame_buf, audio_int16)
+
+        # Cheap energy gate: silence is the common case and Silero inference dominates cost
+        energy = np.dot(self._frame_buf, self._frame_buf) / (self._frame_buf.size or 1)
+        rms = float(np.sqrt(energy)) / 32768.0
+        if rms < self._noise_floor * NOISE_GATE_MARGIN:
+            self._track_noise(rms)
+            return 0.0
+
+        # Scale to Silero's [-1, 1) float range in place; resampling is linear so order is free
+        self._frame_buf *= 1 / 32768.0
+        if self._input_sample_rate == SILERO_SAMPLE_RATE:
+            audio = self._frame_buf
+        else:
+            # Polyphase resampling low-pass filters before decimating, so energy above
+            # 8kHz is removed instead of aliasing into the band Silero listens to
+            audio = resample_poly(
+                self._frame_buf, self._up, self._down, window=self._resample_filter
+            )
+            np.clip(audio, -1.0, 1.0, out=audio)
+
+        confidence = self._silero_confidence(audio)
+        if confidence < NOISE_CONFIDENCE_MAX:
+            self._track_noise(rms)
+        elif confidence > 0.3:
+            logger.info(
+                "VAD confidence: %.2f (in=%d, out=%d)", confidence, len(audio_int16), len(audio)
+            )
+        return confidence
+
+    def _track_noise(self, rms: float) -> None:
+        """Move the noise floor towards the level of a frame judged to be silence."""
+        self._noise_floor += NOISE_FLOOR_ALPHA * (rms - self._noise_floor)
+
+    def _silero_confidence(self, audio: np.ndarray) -> float:
+        """Run the Silero model on 16kHz float32 audio.
+
+        Mirrors SileroVADAnalyzer.voice_confidence, but takes the samples directly
+        so frames are not re-encoded to int16 bytes and parsed back to floats.
+        """
+        try:
+            # The model's output layer already applies the sigmoid, so this is a probability.
+            # Unwrap it to a float so per-frame threshold checks compare scalars, not arrays.
+            confidence = float(self._model(audio, SILERO_SAMPLE_RATE).item())
+        except Exception:
+            logger.exception("Error analyzing audio with Silero VAD")
+            return 0.0
+
+        # Silero's state keeps growing with the audio it sees, so reset it periodically
+        now = time.time()
+        if now - self._last_reset_time >= MODEL_RESET_SECONDS:
+            self._model.reset_states()
+            self._last_reset_time = now
+        return confidence
@@ -0,0 +1,45 @@
+"""Monitored agent registry for worker jobs.
+
+Cron jobs are enqueued every minute with their kwargs serialized to Redis.
+Rather than sending the full agent list each time, they pass a registry key
+and the job looks the list up in this process.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from kairix_agent.config import Config
+
+# Key cron jobs pass to select the monitored agents
+DEFAULT_AGENTS_KEY = "default"
+
+# Build MONITORED_AGENTS from env vars
+# MONITORED_AGENT_IDS: comma-separated list of agent IDs
+# LETTA_BASE_URL: shared Letta server URL for all agents
+MONITORED_AGENTS: list[dict[str, Any]] = [
+    {"agent_id": aid.strip(), "letta_url": Config.LETTA_BASE_URL.value}
+    for aid in Config.MONITORED_AGENT_IDS.value.split(",")
+    if aid.strip()
+]
+
+# Module-level registry of agent lists by key, built once at import
+AGENT_REGISTRY: dict[str, list[dict[str, Any]]] = {DEFAULT_AGENTS_KEY: MONITORED_AGENTS}
+
+
+def resolve_agents(
+    agents: list[dict[str, Any]] | None,
+    agents_key: str,
+) -> list[dict[str, Any]]:
+    """Get the agents a job should check.
+
+    Args:
+        agents: Explicit agent configs, used as-is when given.
+        agents_key: Registry key to look up when no explicit list is given.
+
+    Returns:
+        Agent configs with agent_id and letta_url (empty if the key is unknown).
+    """
+    if agents is not None:
+        return agents
+    return AGENT_REGISTRY.get(agents_key, [])
@@ -0,0 +1,43 @@
+"""Fire-and-forget tasks for worker jobs.
+
+Jobs hand off I/O that their result does not depend on (event publishes)
+so a per-agent check can finish without waiting for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+logger = logging.getLogger(__name__)
+
+# Strong references keep pending tasks alive until they finish
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+def run_in_background(coro: Coroutine[Any, Any, Any]) -> None:
+    """Schedule a coroutine without awaiting it, logging if it fails.
+
+    Args:
+        coro: The coroutine to run.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_done)
+
+
+def _on_done(task: asyncio.Task[Any]) -> None:
+    """Forget a finished task and log its failure, if any."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.error("Background task failed", exc_info=exc)
+
+
+async def drain_background_tasks() -> None:
+    """Wait for all pending background tasks, e.g. before the worker exits."""
+    while _background_tasks:
+        await asyncio.gather(*list(_background_tasks), return_exceptions=True)
@@ -6,19 +6,25 @@ messages to the background insights agent to evaluate/update the insights block.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import deque
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Any
-
-from letta_client import AsyncLetta
-from letta_client.types.agents import AssistantMessage
+from typing import TYPE_CHECKING, Any, cast
 
 from kairix_agent.agent_config import get_agent_config
 from kairix_agent.config import Config
 from kairix_agent.events import EventType, publish_event
-from kairix_agent.worker.jobs.transcript import format_transcript
+from kairix_agent.letta_clients import get_letta_client
+from kairix_agent.worker.agents import DEFAULT_AGENTS_KEY, resolve_agents
+from kairix_agent.worker.background import run_in_background
+from kairix_agent.worker.jobs.prompts import INSIGHTS_PROMPT_PREFIX, INSIGHTS_PROMPT_SUFFIX
+from kairix_agent.worker.jobs.transcript import extract_assistant_text, format_transcript
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from letta_client import AsyncLetta
     from saq.types import Context
 
 logger = logging.getLogger(__name__)
@@ -28,47 +34,108 @@ TRIGGER_INSIGHTS_JOB = "trigger_insights"
 
 RECENT_MESSAGE_COUNT = 10
 
+# Most messages the oldest-first fallback will scan before giving up on an agent
+FALLBACK_MAX_MESSAGES = 1000
 
-async def _check_agent_insights(
+
+async def _fetch_recent_messages(
+        client: AsyncLetta,
+        agent_id: str,
+        count: int,
+) -> list[Any]:
+    """Fetch an agent's most recent messages in chronological order.
+
+    Requests a single newest-first page of `count` messages rather than paging
+    through the whole history. Some Letta servers ignore order=desc; if the page
+    comes back oldest-first, this falls back to listing the history oldest-first,
+    up to FALLBACK_MAX_MESSAGES messages.
+
+    Args:
+        client: Letta client.
+        agent_id: Agent whose messages to fetch.
+        count: Number of messages to return.
+
+    Returns:
+        Up to `count` messages, oldest first. Empty if the fallback hit its limit.
+    """
+    page = await client.agents.messages.list(
+        agent_id=agent_id,
+        limit=count,
+        order="desc",
+        order_by="created_at",
+    )
+    recent: list[Any] = list(page.items)
+
+    if len(recent) > 1 and recent[0].date < recent[-1].date:
+        logger.warning("Letta ignored order=desc for agent %s, listing all messages", agent_id)
+        return await _fetch_recent_messages_oldest_first(client, agent_id, count)
+
+    recent.reverse()
+    return recent
+
+
+async def _fetch_recent_messages_oldest_first(
+        client: AsyncLetta,
+        agent_id: str,
+        count: int,
+) -> list[Any]:
+    """Find an agent's newest messages by scanning its history oldest-first.
+
+    Only the last `count` messages are kept while scanning. The scan stops at
+    FALLBACK_MAX_MESSAGES, so a misbehaving server can't turn every check into
+    a full history read.
+    """
+    tail: deque[Any] = deque(maxlen=count)
+    messages = cast(
+        "AsyncGenerator[Any]",
+        aiter(client.agents.messages.list(agent_id=agent_id, order="asc", order_by="created_at")),
+    )
+    try:
+        scanned = 0
+        async for msg in messages:
+            if scanned == FALLBACK_MAX_MESSAGES:
+                logger.error(
+                    "Agent %s has more than %d messages, skipping insights check",
+                    agent_id,
+                    FALLBACK_MAX_MESSAGES,
+                )
+                return []
+            tail.append(msg)
+            scanned += 1
+    finally:
+        await messages.aclose()
+    return list(tail)
+
+
+async def _run_insights(
         client: AsyncLetta,
         agent_id: str,
         insights_agent_id: str,
+        *,
+        skip_session_gap: bool,
 ) -> dict[str, object]:
-    """Check and potentially update insights for a single agent.
+    """Send an agent's recent conversation to its insights agent for evaluation.
+
+    Shared by the cron check and on-demand triggers.
 
     Args:
         client: Letta client.
         agent_id: Conversational agent ID.
         insights_agent_id: Background insights agent ID.
+        skip_session_gap: Evaluate even if the newest message is older than
+            SESSION_GAP_MINUTES (the caller knows the conversation is active).
 
     Returns:
         Status dict.
     """
-    # Pull all messages and take last N (Letta API ignores order=desc)
-    all_messages: list[Any] = [
-        msg
-        async for msg in client.agents.messages.list(
-            agent_id=agent_id,
-            order="asc",
-            order_by="created_at",
-        )
-    ]
-
-    if len(all_messages) > 1000:
-        msg = f"Agent {agent_id} has {len(all_messages)} messages - need to implement proper pagination"
-        raise RuntimeError(msg)
-
-    # Take last N messages (most recent, in chronological order)
-    messages = all_messages[-RECENT_MESSAGE_COUNT:] if all_messages else []
+    messages = await _fetch_recent_messages(client, agent_id, RECENT_MESSAGE_COUNT)
 
     if not messages:
         logger.info("No messages for agent %s, skipping insights check", agent_id)
         return {"status": "skipped", "reason": "no_messages"}
 
     # Debug: dump message IDs and timestamps
-    logger.info(
-        "Got %d messages for agent %s (from %d total):", len(messages), agent_id, len(all_messages)
-    )
+    logger.info("Got %d messages for agent %s:", len(messages), agent_id)
     for i, m in enumerate(messages[-5:]):
         logger.info("  [%d] %s | %s | %s", i, m.id, m.date, m.message_type)
 
@@ -80,7 +147,7 @@ async def _check_agent_insights(
     gap = now - last_message_time
     session_gap_minutes = Config.SESSION_GAP_MINUTES.value
 
-    if gap >= timedelta(minutes=session_gap_minutes):
+    if not skip_session_gap and gap >= timedelta(minutes=session_gap_minutes):
         logger.debug(
             "No active conversation for agent %s (gap: %s >= %s minutes), skipping",
             agent_id,
@@ -88,13 +155,15 @@ async def _check_agent_insights(
             session_gap_minutes,
         )
         # Publish event with triggered=False (no active conversation)
-        await publish_event(
-            agent_id=agent_id,
-            event_type=EventType.INSIGHTS_COMPLETE,
-            payload={
-                "triggered": False,
-                "response": None,
-            },
+        run_in_background(
+            publish_event(
+                agent_id=agent_id,
+                event_type=EventType.INSIGHTS_COMPLETE,
+                payload={
+                    "triggered": False,
+                    "response": None,
+                },
+            )
         )
         return {
             "status": "skipped",
@@ -105,20 +174,7 @@ async def _check_agent_insights(
     # Active conversation - messages already in chronological order
     conversation_text = format_transcript(messages)
 
-    prompt = f"""Review the current conversation and determine if your background_insights block needs updating.
-
-<recent_conversation>
-{conversation_text}
-</recent_conversation>
-
-Your background_insights block is visible in your memory. Evaluate whether it supports this conversation:
-1. If relevant: respond briefly acknowledging no update needed
-2. If stale/irrelevant:
-   - Search archival memory for relevant context
-   - Optionally search the web for current information
-   - Update the background_insights block using core_memory_replace
-
-Remember: only update if truly necessary. Irrelevant updates add noise."""
+    prompt = INSIGHTS_PROMPT_PREFIX + conversation_text + INSIGHTS_PROMPT_SUFFIX
 
     logger.info(
         "Sending %d messages to insights agent %s for evaluation", len(messages), insights_agent_id
@@ -129,16 +185,7 @@ Remember: only update if truly necessary. Irrelevant updates add noise."""
         input=prompt,
     )
 
-    # Extract response text
-    response_text = ""
-    for msg in response.messages:
-        if isinstance(msg, AssistantMessage) and msg.content:
-            if isinstance(msg.content, str):
-                response_text += msg.content
-            else:
-                for item in msg.content:
-                    if hasattr(item, "text"):
-                        response_text += item.text
+    response_text = extract_assistant_text(response.messages)
 
     logger.info(
         "Insights agent response (%d chars): %s...",
@@ -151,15 +198,17 @@ Remember: only update if truly necessary. Irrelevant updates add noise."""
     logger.debug("Reset insights agent %s message history", insights_agent_id)
 
     # Publish event for connected clients
-    await publish_event(
-        agent_id=agent_id,
-        event_type=EventType.INSIGHTS_COMPLETE,
-        payload={
-            "triggered": True,
-            "response": response_text,
-        },
+    run_in_background(
+        publish_event(
+            agent_id=agent_id,
+            event_type=EventType.INSIGHTS_COMPLETE,
+            payload={
+                "triggered": True,
+                "response": response_text,
+            },
+        )
     )
-    logger.info("Published INSIGHTS_COMPLETE event for agent %s", agent_id)
+    logger.info("Publishing INSIGHTS_COMPLETE event for agent %s", agent_id)
 
     return {
         "status": "ok",
@@ -168,56 +217,98 @@ Remember: only update if truly necessary. Irrelevant updates add noise."""
     }
 
 
-async def check_insights_relevance(
-        _ctx: Context,
-        *,
-        agents: list[dict[str, Any]],
+async def _check_agent_insights(
+        client: AsyncLetta,
+        agent_id: str,
+        insights_agent_id: str,
 ) -> dict[str, object]:
-    """Check if background insights need updating for monitored agents.
-
-    This job runs every minute. For each agent:
-    1. Pull last 10 messages
-    2. If last message is older than SESSION_GAP_MINUTES, skip (no active conversation)
-    3. Otherwise, send messages to insights agent for evaluation
-    4. Reset insights agent after each run
+    """Check and potentially update insights for a single agent.
 
     Args:
-        _ctx: SAQ job context.
-        agents: List of agent configs with agent_id and letta_url.
+        client: Letta client.
+        agent_id: Conversational agent ID.
+        insights_agent_id: Background insights agent ID.
 
     Returns:
-        Status dict with results per agent.
+        Status dict.
     """
-    if not agents:
-        logger.warning("No agents configured, skipping insights check")
-        return {"status": "skipped", "reason": "no_agents_configured"}
+    return await _run_insights(client, agent_id, insights_agent_id, skip_session_gap=False)
 
-    results: dict[str, object] = {}
 
-    for agent_cfg in agents:
-        agent_id = agent_cfg["agent_id"]
-        letta_url = agent_cfg["letta_url"]
+async def _run_agent_insights(
+        agent_cfg: dict[str, Any],
+        limiter: asyncio.Semaphore,
+) -> dict[str, object]:
+    """Run the insights check for one monitored agent, reporting errors as a status.
 
+    Args:
+        agent_cfg: Agent config with agent_id and letta_url.
+        limiter: Bounds how many agents are checked concurrently.
+
+    Returns:
+        Status dict for this agent.
+    """
+    agent_id = agent_cfg["agent_id"]
+    letta_url = agent_cfg["letta_url"]
+
+    async with limiter:
         try:
             # Load agent config to get insights_agent_id
             config = await get_agent_config(agent_id=agent_id, letta_url=letta_url)
 
             if not config.insights_agent_id:
                 logger.debug("No insights agent configured for %s, skipping", agent_id)
-                results[agent_id] = {"status": "skipped", "reason": "no_insights_agent"}
-                continue
+                return {"status": "skipped", "reason": "no_insights_agent"}
 
-            client = AsyncLetta(base_url=letta_url)
-            result = await _check_agent_insights(
+            client = get_letta_client(letta_url)
+            return await _check_agent_insights(
                 client=client,
                 agent_id=agent_id,
                 insights_agent_id=config.insights_agent_id,
             )
-            results[agent_id] = result
 
         except Exception:
             logger.exception("Error checking insights for agent %s", agent_id)
-            results[agent_id] = {"status": "error", "reason": "exception"}
+            return {"status": "error", "reason": "exception"}
+
+
+async def check_insights_relevance(
+        _ctx: Context,
+        *,
+        agents: list[dict[str, Any]] | None = None,
+        agents_key: str = DEFAULT_AGENTS_KEY,
+) -> dict[str, object]:
+    """Check if background insights need updating for monitored agents.
+
+    This job runs every minute. Agents are checked concurrently (up to
+    MAX_CONCURRENT_AGENTS at a time). For each agent:
+    1. Pull last 10 messages
+    2. If last message is older than SESSION_GAP_MINUTES, skip (no active conversation)
+    3. Otherwise, send messages to insights agent for evaluation
+    4. Reset insights agent after each run
+
+    Args:
+        _ctx: SAQ job context.
+        agents: List of agent configs with agent_id and letta_url.
+            Defaults to the registered list for agents_key.
+        agents_key: Registry key of the monitored agents; cron jobs pass this
+            instead of the list so it is not serialized on every tick.
+
+    Returns:
+        Status dict with results per agent.
+    """
+    agents = resolve_agents(agents, agents_key)
+    if not agents:
+        logger.warning("No agents configured, skipping insights check")
+        return {"status": "skipped", "reason": "no_agents_configured"}
+
+    limiter = asyncio.Semaphore(Config.MAX_CONCURRENT_AGENTS.value)
+    statuses = await asyncio.gather(
+        *(_run_agent_insights(agent_cfg, limiter) for agent_cfg in agents)
+    )
+    results: dict[str, object] = {
+        agent_cfg["agent_id"]: status for agent_cfg, status in zip(agents, statuses, strict=True)
+    }
 
     return {"status": "ok", "agents": results}
 
@@ -251,93 +342,11 @@ async def trigger_insights(
             logger.debug("No insights agent configured for %s, skipping", agent_id)
             return {"status": "skipped", "reason": "no_insights_agent"}
 
-        client = AsyncLetta(base_url=letta_url)
-
-        # Use the internal helper but we'll inline a simplified version
-        # that skips the session gap check (we know conversation is active)
-        all_messages: list[Any] = [
-            msg
-            async for msg in client.agents.messages.list(
-                agent_id=agent_id,
-                order="asc",
-                order_by="created_at",
-            )
-        ]
-
-        if len(all_messages) > 1000:
-            msg = f"Agent {agent_id} has {len(all_messages)} messages - need pagination"
-            raise RuntimeError(msg)
-
-        messages = all_messages[-RECENT_MESSAGE_COUNT:] if all_messages else []
-
-        if not messages:
-            logger.info("No messages for agent %s, skipping triggered insights", agent_id)
-            return {"status": "skipped", "reason": "no_messages"}
-
-        # Format and send to insights agent (skip session gap check)
-        conversation_text = format_transcript(messages)
-
-        prompt = f"""Review the current conversation and determine if your background_insights block needs updating.
-
-<recent_conversation>
-{conversation_text}
-</recent_conversation>
-
-Your background_insights block is visible in your memory. Evaluate whether it supports this conversation:
-1. If relevant: respond briefly acknowledging no update needed
-2. If stale/irrelevant:
-   - Search archival memory for relevant context
-   - Optionally search the web for current information
-   - Update the background_insights block using core_memory_replace
-
-Remember: only update if truly necessary. Irrelevant updates add noise."""
-
-        logger.info(
-            "Triggered insights: sending %d messages to insights agent %s",
-            len(messages),
-            config.insights_agent_id,
+        client = get_letta_client(letta_url)
+        return await _run_insights(
+            client, agent_id, config.insights_agent_id, skip_session_gap=True
         )
 
-        response = await client.agents.messages.create(
-            agent_id=config.insights_agent_id,
-            input=prompt,
-        )
-
-        response_text = ""
-        for msg in response.messages:
-            if isinstance(msg, AssistantMessage) and msg.content:
-                if isinstance(msg.content, str):
-                    response_text += msg.content
-                else:
-                    for item in msg.content:
-                        if hasattr(item, "text"):
-                            response_text += item.text
-
-        logger.info(
-            "Triggered insights response (%d chars): %s...",
-            len(response_text),
-            response_text[:100] if response_text else "(empty)",
-        )
-
-        # Reset insights agent
-        await client.agents.messages.reset(agent_id=config.insights_agent_id)
-
-        # Publish event
-        await publish_event(
-            agent_id=agent_id,
-            event_type=EventType.INSIGHTS_COMPLETE,
-            payload={
-                "triggered": True,
-                "response": response_text,
-            },
-        )
-
-        return {
-            "status": "ok",
-            "messages_checked": len(messages),
-            "response_length": len(response_text),
-        }
-
     except Exception:
         logger.exception("Error in triggered insights for agent %s", agent_id)
         return {"status": "error", "reason": "exception"}
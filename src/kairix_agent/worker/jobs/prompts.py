@@ -0,0 +1,20 @@
+"""Prompt text sent by worker jobs to background agents."""
+
+# The insights prompt wraps the formatted transcript; callers concatenate
+# PREFIX + transcript + SUFFIX rather than formatting a template on every run
+INSIGHTS_PROMPT_PREFIX = """Review the current conversation and determine if your background_insights block needs updating.
+
+<recent_conversation>
+"""
+
+INSIGHTS_PROMPT_SUFFIX = """
+</recent_conversation>
+
+Your background_insights block is visible in your memory. Evaluate whether it supports this conversation:
+1. If relevant: respond briefly acknowledging no update needed
+2. If stale/irrelevant:
+   - Search archival memory for relevant context
+   - Optionally search the web for current information
+   - Update the background_insights block using core_memory_replace
+
+Remember: only update if truly necessary. Irrelevant updates add noise."""
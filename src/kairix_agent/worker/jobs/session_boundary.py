@@ -2,27 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from saq import Queue
 
-from kairix_agent.agent_config import get_agent_config
+from kairix_agent.agent_config import get_agent_config, get_agent_configs
 from kairix_agent.config import Config
 from kairix_agent.events import EventType, publish_event
 from kairix_agent.memory import LettaMemoryService
+from kairix_agent.worker.agents import DEFAULT_AGENTS_KEY, resolve_agents
+from kairix_agent.worker.background import run_in_background
 
 if TYPE_CHECKING:
+    from letta_client.types.agents import Message, MessageType
     from saq.types import Context
 
 logger = logging.getLogger(__name__)
 
+# Only user/assistant conversation counts towards a session
+CONVERSATION_MESSAGE_TYPES: list[MessageType] = ["user_message", "assistant_message"]
+
 
 async def _check_agent_session(
     queue: Queue,
     agent_id: str,
     letta_url: str,
+    session_gap: timedelta,
+    now: datetime,
 ) -> dict[str, object]:
     """Check session boundary for a single agent.
 
@@ -30,11 +39,13 @@ async def _check_agent_session(
         queue: SAQ queue for enqueueing summarization jobs.
         agent_id: The agent ID to check.
         letta_url: The Letta server URL.
+        session_gap: Idle time after which a session counts as complete.
+        now: Time of this check, shared by every agent in the tick.
 
     Returns:
         Status dict with detection results for this agent.
     """
-    # Load agent config (cached per agent_id after first call)
+    # Load agent config (cached per agent and Letta URL, reloaded after a TTL)
     agent_config = await get_agent_config(agent_id=agent_id, letta_url=letta_url)
 
     if not agent_config.archive_id:
@@ -50,55 +61,93 @@ async def _check_agent_session(
         base_url=letta_url,
     )
 
+    # Peek at the newest conversation message first, so an active session costs one
+    # single-message fetch. If the server ignores order=desc this sees the oldest
+    # message instead, which can only overstate the gap; the full check below decides.
+    # The conversation is not counted here, so the event reports message_count=0.
+    latest = await memory_service.get_latest_message(message_types=CONVERSATION_MESSAGE_TYPES)
+    if latest is not None:
+        gap = now - latest.date
+        if gap < session_gap:
+            logger.debug(
+                "Session still active for agent %s (gap: %s < %s)",
+                agent_config.agent_id,
+                gap,
+                session_gap,
+            )
+            run_in_background(
+                publish_event(
+                    agent_id=agent_config.agent_id,
+                    event_type=EventType.SESSION_BOUNDARY,
+                    payload={
+                        "boundary_detected": False,
+                        "gap_minutes": gap.total_seconds() / 60,
+                        "message_count": 0,
+                    },
+                )
+            )
+            return {
+                "status": "ok",
+                "session_active": True,
+                "gap_seconds": gap.total_seconds(),
+            }
+
     # Fetch all messages (no cursor needed - messages are reset after summarization)
-    # Filter out system messages - only count user/assistant conversation
-    all_messages = [
-        message async for message in memory_service.get_messages_since(None)
-    ]
-    messages = [
-        m for m in all_messages
-        if m.message_type in ("user_message", "assistant_message")
-    ]
-
-    if not messages:
+    # The server filters out everything but conversation, so system, reasoning and
+    # tool messages are never transferred or parsed. Only the IDs and the first and
+    # last messages are needed, so they are captured in one pass instead of
+    # keeping every message object
+    message_ids: list[str] = []
+    first_message: Message | None = None
+    last_message: Message | None = None
+    async for message in memory_service.get_messages_since(
+        None,
+        message_types=CONVERSATION_MESSAGE_TYPES,
+    ):
+        if first_message is None:
+            first_message = message
+        last_message = message
+        message_ids.append(message.id)
+
+    if first_message is None or last_message is None:
         logger.debug("No conversation messages for agent %s", agent_config.agent_id)
-        await publish_event(
-            agent_id=agent_config.agent_id,
-            event_type=EventType.SESSION_BOUNDARY,
-            payload={
-                "boundary_detected": False,
-                "gap_minutes": 0,
-                "message_count": 0,
-            },
+        run_in_background(
+            publish_event(
+                agent_id=agent_config.agent_id,
+                event_type=EventType.SESSION_BOUNDARY,
+                payload={
+                    "boundary_detected": False,
+                    "gap_minutes": 0,
+                    "message_count": 0,
+                },
+            )
         )
         return {"status": "ok", "messages_found": 0}
 
     # Check if last message is old enough (session gap exceeded)
-    last_message = messages[-1]
-    last_message_time = last_message.date
-    now = datetime.now(tz=UTC)
-    gap = now - last_message_time
-    session_gap_minutes = Config.SESSION_GAP_MINUTES.value
+    gap = now - last_message.date
 
-    if gap < timedelta(minutes=session_gap_minutes):
+    if gap < session_gap:
         logger.debug(
-            "Session still active for agent %s (gap: %s < %s minutes)",
+            "Session still active for agent %s (gap: %s < %s)",
             agent_config.agent_id,
             gap,
-            session_gap_minutes,
+            session_gap,
         )
-        await publish_event(
-            agent_id=agent_config.agent_id,
-            event_type=EventType.SESSION_BOUNDARY,
-            payload={
-                "boundary_detected": False,
-                "gap_minutes": gap.total_seconds() / 60,
-                "message_count": len(messages),
-            },
+        run_in_background(
+            publish_event(
+                agent_id=agent_config.agent_id,
+                event_type=EventType.SESSION_BOUNDARY,
+                payload={
+                    "boundary_detected": False,
+                    "gap_minutes": gap.total_seconds() / 60,
+                    "message_count": len(message_ids),
+                },
+            )
         )
         return {
             "status": "ok",
-            "messages_found": len(messages),
+            "messages_found": len(message_ids),
             "session_active": True,
             "gap_seconds": gap.total_seconds(),
         }
@@ -107,27 +156,27 @@ async def _check_agent_session(
     logger.info(
         "Detected session boundary for agent %s: %d messages, gap %s",
         agent_config.agent_id,
-        len(messages),
+        len(message_ids),
         gap,
     )
 
-    # Extract message IDs for the session
-    message_ids = [m.id for m in messages]
-    first_message = messages[0]
-
     # Publish session boundary event
-    await publish_event(
-        agent_id=agent_config.agent_id,
-        event_type=EventType.SESSION_BOUNDARY,
-        payload={
-            "boundary_detected": True,
-            "gap_minutes": gap.total_seconds() / 60,
-            "message_count": len(messages),
-        },
+    run_in_background(
+        publish_event(
+            agent_id=agent_config.agent_id,
+            event_type=EventType.SESSION_BOUNDARY,
+            payload={
+                "boundary_detected": True,
+                "gap_minutes": gap.total_seconds() / 60,
+                "message_count": len(message_ids),
+            },
+        )
     )
-    logger.info("Published SESSION_BOUNDARY event for agent %s", agent_config.agent_id)
+    logger.info("Publishing SESSION_BOUNDARY event for agent %s", agent_config.agent_id)
 
-    # Enqueue summarization job with extended timeout (LLM calls can take a while)
+    # Enqueue summarization job with extended timeout (LLM calls can take a while).
+    # Only the publish runs in the background; the enqueue is awaited so a failure
+    # surfaces in this agent's status instead of being lost.
     await queue.enqueue(
         "summarize_session",
         agent_id=agent_config.agent_id,
@@ -142,26 +191,68 @@ async def _check_agent_session(
 
     return {
         "status": "ok",
-        "messages_found": len(messages),
+        "messages_found": len(message_ids),
         "session_complete": True,
         "summarization_enqueued": True,
     }
 
 
+async def _run_agent_session(
+    queue: Queue,
+    agent_cfg: dict[str, Any],
+    limiter: asyncio.Semaphore,
+    session_gap: timedelta,
+    now: datetime,
+) -> dict[str, object]:
+    """Run the session boundary check for one agent, reporting errors as a status.
+
+    Args:
+        queue: SAQ queue for enqueueing summarization jobs.
+        agent_cfg: Agent config with 'agent_id' and 'letta_url'.
+        limiter: Bounds how many agents are checked concurrently.
+        session_gap: Idle time after which a session counts as complete.
+        now: Time of this check, shared by every agent in the tick.
+
+    Returns:
+        Status dict for this agent.
+    """
+    agent_id = agent_cfg["agent_id"]
+
+    async with limiter:
+        try:
+            return await _check_agent_session(
+                queue=queue,
+                agent_id=agent_id,
+                letta_url=agent_cfg["letta_url"],
+                session_gap=session_gap,
+                now=now,
+            )
+        except Exception:
+            logger.exception("Error checking session for agent %s", agent_id)
+            return {"status": "error", "reason": "exception"}
+
+
 async def check_session_boundaries(
     ctx: Context,
     *,
-    agents: list[dict[str, Any]],
+    agents: list[dict[str, Any]] | None = None,
+    agents_key: str = DEFAULT_AGENTS_KEY,
 ) -> dict[str, object]:
     """Check for completed sessions across all configured agents.
 
+    Agents are checked concurrently, up to MAX_CONCURRENT_AGENTS at a time.
+
     Args:
         ctx: SAQ job context (contains queue reference for enqueueing).
         agents: List of agent configs, each with 'agent_id' and 'letta_url'.
+            Defaults to the registered list for agents_key.
+        agents_key: Registry key of the monitored agents; cron jobs pass this
+            instead of the list so it is not serialized on every tick.
 
     Returns:
         Status dict with detection results per agent.
     """
+    agents = resolve_agents(agents, agents_key)
     if not agents:
         logger.warning("No agents configured, skipping session check")
         return {"status": "skipped", "reason": "no agents configured"}
@@ -175,21 +266,22 @@ async def check_session_boundaries(
 
     queue: Queue = queue_obj
 
-    results: dict[str, object] = {}
+    # Warm the agent config cache before the checks start, so a cold tick loads
+    # configs in one bounded batch instead of inside each agent's check
+    await get_agent_configs(
+        [(agent_cfg["agent_id"], agent_cfg["letta_url"]) for agent_cfg in agents]
+    )
 
-    for agent_cfg in agents:
-        agent_id = agent_cfg["agent_id"]
-        letta_url = agent_cfg["letta_url"]
+    # Config and the clock are read once per tick rather than once per agent
+    session_gap = timedelta(minutes=Config.SESSION_GAP_MINUTES.value)
+    now = datetime.now(tz=UTC)
 
-        try:
-            result = await _check_agent_session(
-                queue=queue,
-                agent_id=agent_id,
-                letta_url=letta_url,
-            )
-            results[agent_id] = result
-        except Exception:
-            logger.exception("Error checking session for agent %s", agent_id)
-            results[agent_id] = {"status": "error", "reason": "exception"}
+    limiter = asyncio.Semaphore(Config.MAX_CONCURRENT_AGENTS.value)
+    statuses = await asyncio.gather(
+        *(_run_agent_session(queue, agent_cfg, limiter, session_gap, now) for agent_cfg in agents)
+    )
+    results: dict[str, object] = {
+        agent_cfg["agent_id"]: status for agent_cfg, status in zip(agents, statuses, strict=True)
+    }
 
     return {"status": "ok", "agents": results}
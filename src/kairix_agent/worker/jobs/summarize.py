@@ -2,20 +2,77 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
-from letta_client import AsyncLetta
-from letta_client.types.agents import AssistantMessage
-
 from kairix_agent.events import EventType, publish_event
-from kairix_agent.worker.jobs.transcript import format_transcript
+from kairix_agent.letta_clients import get_letta_client
+from kairix_agent.worker.background import run_in_background
+from kairix_agent.worker.jobs.transcript import extract_assistant_text, format_transcript
 
 if TYPE_CHECKING:
+    from letta_client import AsyncLetta
+    from letta_client.types.agents import Message, MessageType
     from saq.types import Context
 
 logger = logging.getLogger(__name__)
 
+# Message types rendered by format_transcript; anything else is not fetched
+TRANSCRIPT_MESSAGE_TYPES: list[MessageType] = [
+    "user_message",
+    "assistant_message",
+    "reasoning_message",
+]
+
+# Extra page room for messages interleaved with the session's conversation IDs
+SESSION_PAGE_MARGIN = 20
+
+
+async def _fetch_session_messages(
+    client: AsyncLetta,
+    agent_id: str,
+    message_ids: list[str],
+) -> list[Message]:
+    """Fetch only the messages in a session's ID range.
+
+    The ``after`` cursor is exclusive, so the first message is retrieved by ID
+    while the rest of the range is listed from it, stopping once the session's
+    last message has been passed. Nothing outside the session is transferred
+    beyond the final page, and listed messages whose IDs are not in the session
+    (e.g. system or tool messages in between) are dropped.
+
+    Args:
+        client: Letta client.
+        agent_id: The conversational agent ID.
+        message_ids: Session message IDs in chronological order.
+
+    Returns:
+        The session messages in chronological order.
+    """
+    first_id, last_id = message_ids[0], message_ids[-1]
+    messages: list[Message] = list(await client.messages.retrieve(first_id))
+    if first_id == last_id:
+        return messages
+
+    # One stored message can expand to several (e.g. reasoning + assistant) sharing an ID
+    session_ids = set(message_ids)
+    reached_last = False
+    async for msg in client.agents.messages.list(
+        agent_id,
+        after=first_id,
+        limit=len(message_ids) + SESSION_PAGE_MARGIN,
+        include_return_message_types=TRANSCRIPT_MESSAGE_TYPES,
+        order="asc",
+        order_by="created_at",
+    ):
+        if reached_last and msg.id != last_id:
+            break
+        if msg.id in session_ids:
+            messages.append(msg)
+        reached_last = msg.id == last_id
+    return messages
+
 
 async def _format_session_for_reflector(
     client: AsyncLetta,
@@ -36,12 +93,7 @@ async def _format_session_for_reflector(
     Returns:
         Formatted prompt string for the reflector.
     """
-    # Fetch messages and filter to those in this session
-    message_id_set = set(message_ids)
-    messages = [
-        msg async for msg in client.agents.messages.list(agent_id)
-        if msg.id in message_id_set
-    ]
+    messages = await _fetch_session_messages(client, agent_id, message_ids)
 
     session_transcript = format_transcript(messages)
 
@@ -65,6 +117,25 @@ Before writing your summary, search archival memory for related past sessions \
 that might provide context."""
 
 
+async def _update_summary_block(client: AsyncLetta, agent_id: str, value: str) -> None:
+    """Update the last_session_summary block, logging rather than raising on failure.
+
+    Args:
+        client: Letta client.
+        agent_id: The conversational agent ID.
+        value: The new block value.
+    """
+    try:
+        await client.agents.blocks.update(
+            "last_session_summary",
+            agent_id=agent_id,
+            value=value,
+        )
+        logger.info("Updated last_session_summary block for agent %s", agent_id)
+    except Exception:
+        logger.exception("Failed to update last_session_summary block")
+
+
 async def summarize_session(
     _ctx: Context,
     *,
@@ -114,7 +185,7 @@ async def summarize_session(
             "agent_id": agent_id,
         }
 
-    client = AsyncLetta(base_url=letta_url)
+    client = get_letta_client(letta_url)
 
     # 1. Format session for reflector
     prompt = await _format_session_for_reflector(
@@ -128,18 +199,8 @@ async def summarize_session(
         input=prompt,
     )
 
-    # Extract summary from response - look for AssistantMessage with content
-    summary_text = ""
-    for msg in response.messages:
-        if isinstance(msg, AssistantMessage) and msg.content:
-            # content can be a string or list of content items
-            if isinstance(msg.content, str):
-                summary_text += msg.content
-            else:
-                # It's a list of content items, extract text from each
-                for item in msg.content:
-                    if hasattr(item, "text"):
-                        summary_text += item.text
+    # Extract summary from response - the text of every AssistantMessage with content
+    summary_text = extract_assistant_text(response.messages)
 
     if not summary_text:
         logger.warning("Reflector returned empty summary")
@@ -151,43 +212,43 @@ async def summarize_session(
 
     logger.info("Received summary (%d chars) from reflector", len(summary_text))
 
-    # 3. Reset the reflector agent to prevent context buildup
-    await client.agents.messages.reset(agent_id=reflector_agent_id)
-    logger.info("Reset reflector agent %s message history", reflector_agent_id)
-
-    # 4. Store summary in archival memory
-    await client.archives.passages.create(
-        archive_id=archive_id,
-        text=f"[Session Summary: {period_start} to {period_end}]\n\n{summary_text}",
+    # 3-5. Reset the reflector agent to prevent context buildup, store the summary
+    # in archival memory, and update the last_session_summary block in the
+    # conversational agent's core memory (keeps the summary in-window for continuity
+    # after reset). None depends on another, so they run concurrently.
+    await asyncio.gather(
+        client.agents.messages.reset(agent_id=reflector_agent_id),
+        client.archives.passages.create(
+            archive_id=archive_id,
+            text=f"[Session Summary: {period_start} to {period_end}]\n\n{summary_text}",
+        ),
+        _update_summary_block(
+            client,
+            agent_id,
+            f"[Session: {period_start} to {period_end}]\n\n{summary_text}",
+        ),
     )
+    logger.info("Reset reflector agent %s message history", reflector_agent_id)
     logger.info("Stored summary in archival memory (archive %s)", archive_id)
 
-    # 5. Update the last_session_summary block in the conversational agent's core memory
-    # This keeps the summary in-window for continuity after reset
-    try:
-        await client.agents.blocks.update(
-            "last_session_summary",
-            agent_id=agent_id,
-            value=f"[Session: {period_start} to {period_end}]\n\n{summary_text}",
-        )
-        logger.info("Updated last_session_summary block for agent %s", agent_id)
-    except Exception:
-        logger.exception("Failed to update last_session_summary block")
-
-    # 6. Reset message history (Letta preserves the system message automatically)
+    # 6. Reset message history only once the summary is safely stored
+    # (Letta preserves the system message automatically)
     await client.agents.messages.reset(agent_id=agent_id)
     logger.info("Reset message history for agent %s (system message preserved)", agent_id)
 
-    # 7. Publish event for connected clients
-    await publish_event(
-        agent_id=agent_id,
-        event_type=EventType.SUMMARY_COMPLETE,
-        payload={
-            "message_count": len(message_ids),
-            "summary": summary_text,
-        },
+    # 7. Publish event for connected clients in the background, so the job's worker
+    # slot is not held while the summary is sent
+    run_in_background(
+        publish_event(
+            agent_id=agent_id,
+            event_type=EventType.SUMMARY_COMPLETE,
+            payload={
+                "message_count": len(message_ids),
+                "summary": summary_text,
+            },
+        )
     )
-    logger.info("Published SUMMARY_COMPLETE event for agent %s", agent_id)
+    logger.info("Publishing SUMMARY_COMPLETE event for agent %s", agent_id)
 
     return {
         "status": "ok",
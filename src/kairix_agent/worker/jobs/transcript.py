@@ -1,6 +1,7 @@
 """Shared transcript formatting for worker jobs."""
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from letta_client.types.agents import (
@@ -12,6 +13,31 @@ from letta_client.types.agents import (
 logger = logging.getLogger(__name__)
 
 
+def _format_user(msg: UserMessage) -> str:
+    """Format a user message line."""
+    content = msg.content if isinstance(msg.content, str) else str(msg.content)
+    return f"[user]: {content}"
+
+
+def _format_assistant(msg: AssistantMessage) -> str:
+    """Format an assistant message line."""
+    content = msg.content if isinstance(msg.content, str) else str(msg.content)
+    return f"[assistant]: {content}"
+
+
+def _format_reasoning(msg: ReasoningMessage) -> str:
+    """Format a reasoning message line."""
+    return f"[reasoning]: {msg.reasoning}"
+
+
+# Formatter per concrete message class; one dict lookup per message instead of an isinstance chain
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    UserMessage: _format_user,
+    AssistantMessage: _format_assistant,
+    ReasoningMessage: _format_reasoning,
+}
+
+
 def format_transcript(messages: list[Any]) -> str:
     """Format Letta messages into a readable transcript.
 
@@ -27,17 +53,32 @@ def format_transcript(messages: list[Any]) -> str:
     formatted: list[str] = []
 
     for msg in messages:
-        if isinstance(msg, UserMessage):
-            content = msg.content if isinstance(msg.content, str) else str(msg.content)
-            formatted.append(f"[user]: {content}")
-        elif isinstance(msg, AssistantMessage):
-            content = msg.content if isinstance(msg.content, str) else str(msg.content)
-            formatted.append(f"[assistant]: {content}")
-        elif isinstance(msg, ReasoningMessage):
-            formatted.append(f"[reasoning]: {msg.reasoning}")
+        formatter = _FORMATTERS.get(type(msg))
+        if formatter is not None:
+            formatted.append(formatter(msg))
         else:
             # Log and skip everything else (system, tool calls, tool returns, etc.)
             msg_type = type(msg).__name__
             logger.debug("Skipping message type: %s", msg_type)
 
-    return "\n".join(formatted) if formatted else "(no messages)"
\ No newline at end of file
+    return "\n".join(formatted) if formatted else "(no messages)"
+
+
+def extract_assistant_text(messages: list[Any]) -> str:
+    """Join the text of every assistant message in an agent response.
+
+    Content is either a plain string or a list of content items, each a
+    LettaAssistantMessageContentUnion, which always has text.
+
+    Args:
+        messages: Letta messages from an agent response.
+
+    Returns:
+        The assistant text, or an empty string if there was none.
+    """
+    return "".join(
+        content if isinstance(content, str) else "".join(item.text for item in content)
+        for content in (
+            msg.content for msg in messages if isinstance(msg, AssistantMessage) and msg.content
+        )
+    )
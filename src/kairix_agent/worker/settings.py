@@ -8,11 +8,15 @@ Run with: saq kairix_agent.worker.settings
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 from saq import CronJob, Queue
 
 from kairix_agent.config import Config
+from kairix_agent.letta_clients import close_letta_clients
 from kairix_agent.logging_config import setup_logging
+from kairix_agent.worker.agents import DEFAULT_AGENTS_KEY, MONITORED_AGENTS
+from kairix_agent.worker.background import drain_background_tasks
 from kairix_agent.worker.jobs import (
     check_insights_relevance,
     check_session_boundaries,
@@ -20,6 +24,9 @@ from kairix_agent.worker.jobs import (
     trigger_insights,
 )
 
+if TYPE_CHECKING:
+    from saq.types import Context
+
 # Configure logging before anything else
 setup_logging("worker")
 
@@ -29,19 +36,11 @@ logger = logging.getLogger(__name__)
 queue = Queue.from_url(Config.REDIS_URL.value)
 logger.info("Created queue: %s (redis_url=%s)", queue, Config.REDIS_URL.value)
 
-# Build MONITORED_AGENTS from env vars
-# MONITORED_AGENT_IDS: comma-separated list of agent IDs
-# LETTA_BASE_URL: shared Letta server URL for all agents
-_agent_ids = [
-    aid.strip()
-    for aid in Config.MONITORED_AGENT_IDS.value.split(",")
-    if aid.strip()
-]
-MONITORED_AGENTS = [
-    {"agent_id": aid, "letta_url": Config.LETTA_BASE_URL.value}
-    for aid in _agent_ids
-]
-logger.info("Monitoring %d agents: %s", len(MONITORED_AGENTS), _agent_ids)
+logger.info(
+    "Monitoring %d agents: %s",
+    len(MONITORED_AGENTS),
+    [agent["agent_id"] for agent in MONITORED_AGENTS],
+)
 
 # Job-specific timeout settings (in seconds)
 # summarize_session can take a while due to LLM calls
@@ -52,21 +51,29 @@ JOB_TIMEOUTS = {
     "trigger_insights": 60,  # 1 minute for on-demand insights
 }
 
+
+async def shutdown(_ctx: Context) -> None:
+    """Flush pending event publishes and enqueues, then close shared Letta clients."""
+    await drain_background_tasks()
+    await close_letta_clients()
+
+
 settings = {
     "queue": queue,
     "functions": [check_insights_relevance, check_session_boundaries, summarize_session, trigger_insights],
     "concurrency": 5,
+    "shutdown": shutdown,
     "cron_jobs": [
         CronJob(
             check_session_boundaries,
             cron="* * * * *",  # Every minute
-            kwargs={"agents": MONITORED_AGENTS},
+            kwargs={"agents_key": DEFAULT_AGENTS_KEY},
             timeout=JOB_TIMEOUTS["check_session_boundaries"],
         ),
         CronJob(
             check_insights_relevance,
             cron="* * * * *",  # Every minute
-            kwargs={"agents": MONITORED_AGENTS},
+            kwargs={"agents_key": DEFAULT_AGENTS_KEY},
             timeout=JOB_TIMEOUTS["check_insights_relevance"],
         ),
     ],
@@ -0,0 +1,107 @@
+"""Tests for ConnectionManager backpressure and per-agent limits."""
+
+import asyncio
+import importlib
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from fastapi import status
+
+from kairix_agent.server.events.connection_manager import ConnectionManager
+
+# The package re-exports the connection_manager singleton under the module's name,
+# so the module itself (for patching its limits) is looked up by path
+cm = importlib.import_module("kairix_agent.server.events.connection_manager")
+
+pytestmark = pytest.mark.asyncio
+
+AGENT_ID = "agent-1"
+
+
+class FakeWebSocket:
+    """Stand-in for a FastAPI WebSocket that records what it is sent.
+
+    A stalled socket never completes a send, like a client that stopped reading.
+    """
+
+    def __init__(self, *, stalled: bool = False) -> None:
+        self.sent: list[str] = []
+        self.close_code: int | None = None
+        self._stalled = stalled
+
+    async def send_text(self, message: str) -> None:
+        if self._stalled:
+            await asyncio.Event().wait()
+        self.sent.append(message)
+
+    async def close(self, code: int) -> None:
+        self.close_code = code
+
+
+async def settle() -> None:
+    """Helper to let writer and close tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest_asyncio.fixture
+async def manager() -> AsyncIterator[ConnectionManager]:
+    """Create a manager and cancel any writers left when the test ends."""
+    manager = ConnectionManager()
+    yield manager
+    for agent_id, clients in list(manager._connections.items()):
+        for websocket in list(clients):
+            await manager.unregister(agent_id, websocket)
+
+
+async def test_full_queue_drops_slow_client(
+    manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A client whose queue overflows is unregistered and closed; others keep receiving."""
+    monkeypatch.setattr(cm, "OUTBOUND_QUEUE_SIZE", 2)
+    slow = FakeWebSocket(stalled=True)
+    fast = FakeWebSocket()
+    await manager.register(AGENT_ID, slow)  # type: ignore[arg-type]
+    await manager.register(AGENT_ID, fast)  # type: ignore[arg-type]
+
+    # The slow writer takes the first event and stalls; two more fill its queue
+    for i in range(4):
+        await manager.dispatch(AGENT_ID, f'{{"n":{i}}}')
+        await settle()
+
+    assert slow.close_code == status.WS_1013_TRY_AGAIN_LATER
+    assert list(manager._connections[AGENT_ID]) == [fast]
+    assert fast.sent == ['{"n":0}', '{"n":1}', '{"n":2}', '{"n":3}']
+
+
+async def test_stalled_send_times_out_and_closes(
+    manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A send that outlasts SEND_TIMEOUT_SECONDS closes the client."""
+    monkeypatch.setattr(cm, "SEND_TIMEOUT_SECONDS", 0.01)
+    stalled = FakeWebSocket(stalled=True)
+    await manager.register(AGENT_ID, stalled)  # type: ignore[arg-type]
+
+    await manager.dispatch(AGENT_ID, '{"n":0}')
+    await asyncio.sleep(0.05)
+
+    assert stalled.close_code == status.WS_1013_TRY_AGAIN_LATER
+
+
+async def test_oldest_client_evicted_at_per_agent_cap(
+    manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Registering past MAX_PER_AGENT closes the oldest client for that agent."""
+    monkeypatch.setattr(cm, "MAX_PER_AGENT", 2)
+    oldest, middle, newest = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    for websocket in (oldest, middle, newest):
+        await manager.register(AGENT_ID, websocket)  # type: ignore[arg-type]
+
+    await manager.dispatch(AGENT_ID, '{"n":0}')
+    await settle()
+
+    assert oldest.close_code == status.WS_1013_TRY_AGAIN_LATER
+    assert list(manager._connections[AGENT_ID]) == [middle, newest]
+    assert oldest.sent == []
+    assert middle.sent == newest.sent == ['{"n":0}']
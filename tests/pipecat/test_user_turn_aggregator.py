@@ -1,9 +1,12 @@
 """Tests for UserTurnAggregator state machine."""
 
-from unittest.mock import AsyncMock
+import functools
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
 import pytest
 from pipecat.frames.frames import (
+    Frame,
     InterimTranscriptionFrame,
     TextFrame,
     TranscriptionFrame,
@@ -18,286 +21,253 @@ from kairix_agent.server.pipecat.user_turn_aggregator import (
     UserTurnState,
 )
 
+# Every test runs on one module-scoped event loop instead of a new loop per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def aggregator() -> UserTurnAggregator:
-    """Create a fresh aggregator for each test."""
-    return UserTurnAggregator(aggregation_timeout=0.5)
-
-
-@pytest.fixture
-def mock_push_frame(aggregator: UserTurnAggregator) -> AsyncMock:
-    """Mock the push_frame method to capture outputs."""
-    mock = AsyncMock()
-    aggregator.push_frame = mock
-    return mock
-
-
-def make_transcription(text: str) -> TranscriptionFrame:
-    """Helper to create a TranscriptionFrame."""
-    return TranscriptionFrame(text=text, user_id="test-user", timestamp="0")
-
+# Directions bound once rather than looked up on the enum in every call
+_DOWN = FrameDirection.DOWNSTREAM
+_UP = FrameDirection.UPSTREAM
 
-def make_interim(text: str) -> InterimTranscriptionFrame:
-    """Helper to create an InterimTranscriptionFrame."""
-    return InterimTranscriptionFrame(text=text, user_id="test-user", timestamp="0")
-
-
-class TestIdleState:
-    """Tests for IDLE state transitions."""
-
-    @pytest.mark.asyncio
-    async def test_user_started_transitions_to_speaking_awaiting(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """IDLE + UserStartedSpeakingFrame → SPEAKING_AWAITING_TRANSCRIPT"""
-        assert aggregator._state == UserTurnState.IDLE
-
-        frame = UserStartedSpeakingFrame()
-        await aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
-
-        assert aggregator._state == UserTurnState.SPEAKING_AWAITING_TRANSCRIPT
-        mock_push_frame.assert_called_once_with(frame, FrameDirection.DOWNSTREAM)
 
-    @pytest.mark.asyncio
-    async def test_transcription_in_idle_is_ignored(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """IDLE + TranscriptionFrame → stay IDLE, don't pass through"""
-        frame = make_transcription("unexpected")
-        await aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
-
-        assert aggregator._state == UserTurnState.IDLE
-        assert aggregator._aggregation == ""
-        mock_push_frame.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_interim_in_idle_is_ignored(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """IDLE + InterimTranscriptionFrame → stay IDLE, don't pass through"""
-        frame = make_interim("unexpected")
-        await aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+@pytest.fixture(scope="module")
+def shared_aggregator() -> UserTurnAggregator:
+    """Create one aggregator for the whole module."""
+    return UserTurnAggregator(aggregation_timeout=0.5)
 
-        assert aggregator._state == UserTurnState.IDLE
-        mock_push_frame.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_other_frames_pass_through(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """IDLE + other frame → pass through unchanged"""
-        frame = TextFrame(text="hello")
-        await aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
-
-        assert aggregator._state == UserTurnState.IDLE
-        mock_push_frame.assert_called_once_with(frame, FrameDirection.DOWNSTREAM)
+@pytest.fixture
+def aggregator(shared_aggregator: UserTurnAggregator) -> UserTurnAggregator:
+    """Reset the shared aggregator to IDLE for each test."""
+    shared_aggregator.reset_state()
+    return shared_aggregator
 
 
-class TestSpeakingAwaitingTranscriptState:
-    """Tests for SPEAKING_AWAITING_TRANSCRIPT state transitions."""
+class PushCapture:
+    """Lightweight stand-in for push_frame that records its calls.
 
-    @pytest.fixture
-    def speaking_aggregator(self, aggregator: UserTurnAggregator) -> UserTurnAggregator:
-        """Aggregator already in SPEAKING_AWAITING_TRANSCRIPT state."""
-        aggregator._state = UserTurnState.SPEAKING_AWAITING_TRANSCRIPT
-        return aggregator
+    Calls are stored as (args, kwargs) tuples, so ``call_args_list[i][0][0]``
+    is the pushed frame, as with a mock. Frames are also bucketed by type as
+    they arrive, so tests can fetch e.g. every UserTurnMessageFrame directly.
+    """
 
-    @pytest.mark.asyncio
-    async def test_interim_sets_pending_flag(
-        self, speaking_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """SPEAKING_AWAITING + InterimTranscriptionFrame → set pending, stay"""
-        frame = make_interim("partial")
-        await speaking_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+    def __init__(self) -> None:
+        self.call_args_list: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self._by_type: dict[type, list[Any]] = {}
 
-        assert speaking_aggregator._state == UserTurnState.SPEAKING_AWAITING_TRANSCRIPT
-        assert speaking_aggregator._pending_interim is True
-        mock_push_frame.assert_not_called()
+    async def __call__(self, *args: object, **kwargs: object) -> None:
+        self.call_args_list.append((args, kwargs))
+        self._by_type.setdefault(type(args[0]), []).append(args[0])
 
-    @pytest.mark.asyncio
-    async def test_transcription_transitions_to_received(
-        self, speaking_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """SPEAKING_AWAITING + TranscriptionFrame → SPEAKING_RECEIVED_TRANSCRIPT"""
-        frame = make_transcription("hello world")
-        await speaking_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
-
-        assert speaking_aggregator._state == UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT
-        assert speaking_aggregator._aggregation == "hello world"
-        assert speaking_aggregator._pending_interim is False
-        mock_push_frame.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_user_stopped_no_pending_resets_to_idle(
-        self, speaking_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """SPEAKING_AWAITING + UserStoppedSpeakingFrame (no pending) → IDLE"""
-        speaking_aggregator._pending_interim = False
-        frame = UserStoppedSpeakingFrame()
-        await speaking_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+    def pushed[FrameT: Frame](self, frame_type: type[FrameT]) -> list[FrameT]:
+        """Frames of exactly this type that were pushed, in order."""
+        return self._by_type.get(frame_type, [])
 
-        assert speaking_aggregator._state == UserTurnState.IDLE
-        mock_push_frame.assert_called_once_with(frame, FrameDirection.DOWNSTREAM)
+    @property
+    def call_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """The most recent call."""
+        return self.call_args_list[-1]
 
-    @pytest.mark.asyncio
-    async def test_user_stopped_with_pending_transitions_to_done_awaiting(
-        self, speaking_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """SPEAKING_AWAITING + UserStoppedSpeakingFrame (pending) → DONE_AWAITING"""
-        speaking_aggregator._pending_interim = True
-        frame = UserStoppedSpeakingFrame()
-        await speaking_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+    def assert_not_called(self) -> None:
+        assert not self.call_args_list, f"Expected no calls, got {self.call_args_list}"
 
-        assert speaking_aggregator._state == UserTurnState.DONE_AWAITING_TRANSCRIPT
-        assert speaking_aggregator._done_received_at is not None
-        mock_push_frame.assert_called_once_with(frame, FrameDirection.DOWNSTREAM)
+    def assert_called_once(self) -> None:
+        assert len(self.call_args_list) == 1, f"Expected 1 call, got {self.call_args_list}"
 
+    def assert_called_once_with(self, *args: object, **kwargs: object) -> None:
+        self.assert_called_once()
+        assert self.call_args == (args, kwargs), f"Unexpected call {self.call_args}"
 
-class TestSpeakingReceivedTranscriptState:
-    """Tests for SPEAKING_RECEIVED_TRANSCRIPT state transitions."""
 
-    @pytest.fixture
-    def received_aggregator(self, aggregator: UserTurnAggregator) -> UserTurnAggregator:
-        """Aggregator in SPEAKING_RECEIVED_TRANSCRIPT with some text."""
-        aggregator._state = UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT
-        aggregator._aggregation = "hello "
-        return aggregator
-
-    @pytest.mark.asyncio
-    async def test_transcription_appends_and_stays(
-        self, received_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """SPEAKING_RECEIVED + TranscriptionFrame → append, stay"""
-        frame = make_transcription("world")
-        await received_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+# Start/stop are signal frames the aggregator only passes through, so the
+# conversation flows share one of each instead of building new ones per step
+@pytest.fixture(scope="module")
+def start_frame() -> UserStartedSpeakingFrame:
+    """Create one UserStartedSpeakingFrame for the whole module."""
+    return UserStartedSpeakingFrame()
 
-        assert received_aggregator._state == UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT
-        assert received_aggregator._aggregation == "hello world"
-        mock_push_frame.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_interim_sets_pending(
-        self, received_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """SPEAKING_RECEIVED + InterimTranscriptionFrame → set pending"""
-        frame = make_interim("partial")
-        await received_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+@pytest.fixture(scope="module")
+def stop_frame() -> UserStoppedSpeakingFrame:
+    """Create one UserStoppedSpeakingFrame for the whole module."""
+    return UserStoppedSpeakingFrame()
 
-        assert received_aggregator._pending_interim is True
-        mock_push_frame.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_user_stopped_no_pending_pushes_message(
-        self, received_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """SPEAKING_RECEIVED + UserStoppedSpeakingFrame (no pending) → push and IDLE"""
-        received_aggregator._pending_interim = False
-        frame = UserStoppedSpeakingFrame()
-        await received_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+@pytest.fixture
+def mock_push_frame(aggregator: UserTurnAggregator) -> PushCapture:
+    """Replace the push_frame method to capture outputs."""
+    capture = PushCapture()
+    aggregator.push_frame = capture  # type: ignore[method-assign]
+    return capture
 
-        assert received_aggregator._state == UserTurnState.IDLE
-        assert received_aggregator._aggregation == ""
 
-        # Should have pushed UserTurnMessageFrame then the stop frame
-        calls = mock_push_frame.call_args_list
-        assert len(calls) == 2
-        assert isinstance(calls[0][0][0], UserTurnMessageFrame)
-        assert calls[0][0][0].text == "hello "
-        assert calls[1][0][0] == frame
+# Frames are only passed through by the aggregator, never mutated, so one
+# frame per text can be shared by every test that sends it
+@functools.lru_cache(maxsize=64)
+def make_transcription(text: str) -> TranscriptionFrame:
+    """Helper to create (or reuse) a TranscriptionFrame."""
+    return TranscriptionFrame(text=text, user_id="test-user", timestamp="0")
 
-    @pytest.mark.asyncio
-    async def test_user_stopped_with_pending_transitions_to_done_awaiting(
-        self, received_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """SPEAKING_RECEIVED + UserStoppedSpeakingFrame (pending) → DONE_AWAITING"""
-        received_aggregator._pending_interim = True
-        frame = UserStoppedSpeakingFrame()
-        await received_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
-
-        assert received_aggregator._state == UserTurnState.DONE_AWAITING_TRANSCRIPT
-        assert received_aggregator._done_received_at is not None
-        # Message not pushed yet - waiting for final
-        calls = mock_push_frame.call_args_list
-        assert len(calls) == 1
-        assert calls[0][0][0] == frame
 
+@functools.lru_cache(maxsize=64)
+def make_interim(text: str) -> InterimTranscriptionFrame:
+    """Helper to create (or reuse) an InterimTranscriptionFrame."""
+    return InterimTranscriptionFrame(text=text, user_id="test-user", timestamp="0")
 
-class TestDoneAwaitingTranscriptState:
-    """Tests for DONE_AWAITING_TRANSCRIPT state transitions."""
 
-    @pytest.fixture
-    def done_awaiting_aggregator(self, aggregator: UserTurnAggregator) -> UserTurnAggregator:
-        """Aggregator in DONE_AWAITING_TRANSCRIPT with buffered text."""
-        aggregator._state = UserTurnState.DONE_AWAITING_TRANSCRIPT
-        aggregator._aggregation = "hello "
-        aggregator._pending_interim = True
+async def process_frames(
+    aggregator: UserTurnAggregator,
+    frames: list[Frame],
+    direction: FrameDirection = _DOWN,
+) -> None:
+    """Helper to feed a sequence of frames that needs no checks in between."""
+    for frame in frames:
+        await aggregator.process_frame(frame, direction)
+
+
+class Transition(NamedTuple):
+    """Expected outcome of one (state, frame, pending interim) cell."""
+
+    state: UserTurnState
+    # "frame" is the input frame passed through; "message:<text>" a UserTurnMessageFrame
+    pushed: tuple[str, ...]
+    aggregation: str
+    pending_interim: bool
+
+
+# Frame sent for each frame type in the table
+FRAME_FACTORIES: dict[type[Frame], Callable[[], Frame]] = {
+    UserStartedSpeakingFrame: UserStartedSpeakingFrame,
+    InterimTranscriptionFrame: lambda: make_interim("partial"),
+    TranscriptionFrame: lambda: make_transcription("world"),
+    UserStoppedSpeakingFrame: UserStoppedSpeakingFrame,
+    TextFrame: lambda: TextFrame(text="hello"),
+}
+
+# Text already aggregated when a cell starts in each state
+START_AGGREGATION: dict[UserTurnState, str] = {
+    UserTurnState.IDLE: "",
+    UserTurnState.SPEAKING_AWAITING_TRANSCRIPT: "",
+    UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT: "hello ",
+    UserTurnState.DONE_AWAITING_TRANSCRIPT: "hello ",
+}
+
+# (start state, frame type, pending interim) → expected outcome
+TRANSITION_TABLE: dict[tuple[UserTurnState, type[Frame], bool], Transition] = {
+    # IDLE: only a start frame begins a turn; stray transcripts are dropped
+    (UserTurnState.IDLE, UserStartedSpeakingFrame, False): Transition(
+        UserTurnState.SPEAKING_AWAITING_TRANSCRIPT, ("frame",), "", False
+    ),
+    (UserTurnState.IDLE, TranscriptionFrame, False): Transition(UserTurnState.IDLE, (), "", False),
+    (UserTurnState.IDLE, InterimTranscriptionFrame, False): Transition(
+        UserTurnState.IDLE, (), "", False
+    ),
+    (UserTurnState.IDLE, TextFrame, False): Transition(UserTurnState.IDLE, ("frame",), "", False),
+    # SPEAKING_AWAITING_TRANSCRIPT: first final moves on, stop waits only if pending
+    (UserTurnState.SPEAKING_AWAITING_TRANSCRIPT, InterimTranscriptionFrame, False): Transition(
+        UserTurnState.SPEAKING_AWAITING_TRANSCRIPT, (), "", True
+    ),
+    (UserTurnState.SPEAKING_AWAITING_TRANSCRIPT, TranscriptionFrame, False): Transition(
+        UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT, (), "world", False
+    ),
+    (UserTurnState.SPEAKING_AWAITING_TRANSCRIPT, UserStoppedSpeakingFrame, False): Transition(
+        UserTurnState.IDLE, ("frame",), "", False
+    ),
+    (UserTurnState.SPEAKING_AWAITING_TRANSCRIPT, UserStoppedSpeakingFrame, True): Transition(
+        UserTurnState.DONE_AWAITING_TRANSCRIPT, ("frame",), "", True
+    ),
+    # SPEAKING_RECEIVED_TRANSCRIPT: finals append, stop pushes unless more are pending
+    (UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT, TranscriptionFrame, False): Transition(
+        UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT, (), "hello world", False
+    ),
+    (UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT, InterimTranscriptionFrame, False): Transition(
+        UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT, (), "hello ", True
+    ),
+    (UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT, UserStoppedSpeakingFrame, False): Transition(
+        UserTurnState.IDLE, ("message:hello ", "frame"), "", False
+    ),
+    (UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT, UserStoppedSpeakingFrame, True): Transition(
+        UserTurnState.DONE_AWAITING_TRANSCRIPT, ("frame",), "hello ", True
+    ),
+    # DONE_AWAITING_TRANSCRIPT: the final (or a new turn) pushes what was buffered
+    (UserTurnState.DONE_AWAITING_TRANSCRIPT, TranscriptionFrame, True): Transition(
+        UserTurnState.IDLE, ("message:hello world",), "", False
+    ),
+    (UserTurnState.DONE_AWAITING_TRANSCRIPT, UserStartedSpeakingFrame, True): Transition(
+        UserTurnState.SPEAKING_AWAITING_TRANSCRIPT, ("message:hello ", "frame"), "", False
+    ),
+    (UserTurnState.DONE_AWAITING_TRANSCRIPT, InterimTranscriptionFrame, True): Transition(
+        UserTurnState.DONE_AWAITING_TRANSCRIPT, (), "hello ", True
+    ),
+}
+
+
+def describe_pushed(capture: PushCapture, frame: Frame) -> tuple[str, ...]:
+    """Helper to summarize pushed frames in the table's notation."""
+    return tuple(
+        "frame" if pushed is frame else f"message:{pushed.text}"
+        for (pushed, *_), _ in capture.call_args_list
+    )
+
+
+@pytest.mark.parametrize(
+    ("start", "frame_type", "pending_interim", "expected"),
+    [(*cell, expected) for cell, expected in TRANSITION_TABLE.items()],
+    ids=[
+        f"{start.name}-{frame_type.__name__}{'-pending' if pending else ''}"
+        for start, frame_type, pending in TRANSITION_TABLE
+    ],
+)
+async def test_transition(
+    aggregator: UserTurnAggregator,
+    mock_push_frame: PushCapture,
+    start: UserTurnState,
+    frame_type: type[Frame],
+    pending_interim: bool,
+    expected: Transition,
+) -> None:
+    """Each (state, frame) cell lands in its expected state with its expected pushes."""
+    aggregator._state = start
+    aggregator.append_text(START_AGGREGATION[start])
+    aggregator._pending_interim = pending_interim
+    if start == UserTurnState.DONE_AWAITING_TRANSCRIPT:
         aggregator.mark_done_received()
-        return aggregator
-
-    @pytest.mark.asyncio
-    async def test_transcription_pushes_and_resets(
-        self, done_awaiting_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """DONE_AWAITING + TranscriptionFrame → append, push, IDLE"""
-        frame = make_transcription("world")
-        await done_awaiting_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
 
-        assert done_awaiting_aggregator._state == UserTurnState.IDLE
-        assert done_awaiting_aggregator._aggregation == ""
+    frame = FRAME_FACTORIES[frame_type]()
+    await aggregator.process_frame(frame, _DOWN)
 
-        mock_push_frame.assert_called_once()
-        pushed = mock_push_frame.call_args[0][0]
-        assert isinstance(pushed, UserTurnMessageFrame)
-        assert pushed.text == "hello world"
-
-    @pytest.mark.asyncio
-    async def test_user_started_pushes_partial_and_starts_new_turn(
-        self, done_awaiting_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """DONE_AWAITING + UserStartedSpeakingFrame → push partial, start new turn"""
-        frame = UserStartedSpeakingFrame()
-        await done_awaiting_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
-
-        assert done_awaiting_aggregator._state == UserTurnState.SPEAKING_AWAITING_TRANSCRIPT
-
-        calls = mock_push_frame.call_args_list
-        assert len(calls) == 2
-        # First: push the partial message
-        assert isinstance(calls[0][0][0], UserTurnMessageFrame)
-        assert calls[0][0][0].text == "hello "
-        # Second: pass through the start frame
-        assert calls[1][0][0] == frame
-
-    @pytest.mark.asyncio
-    async def test_interim_keeps_waiting(
-        self, done_awaiting_aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
-    ) -> None:
-        """DONE_AWAITING + InterimTranscriptionFrame → stay, keep pending"""
-        frame = make_interim("more coming")
-        await done_awaiting_aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
-
-        assert done_awaiting_aggregator._state == UserTurnState.DONE_AWAITING_TRANSCRIPT
-        assert done_awaiting_aggregator._pending_interim is True
-        mock_push_frame.assert_not_called()
+    assert aggregator._state == expected.state
+    assert describe_pushed(mock_push_frame, frame) == expected.pushed
+    assert aggregator._aggregation == expected.aggregation
+    assert aggregator._pending_interim is expected.pending_interim
+    # Only the waiting state keeps the time the user stopped speaking
+    waiting = expected.state == UserTurnState.DONE_AWAITING_TRANSCRIPT
+    assert (aggregator._done_received_at is not None) is waiting
 
 
 class TestTimeoutBehavior:
     """Tests for timeout behavior in DONE_AWAITING_TRANSCRIPT state."""
 
-    @pytest.mark.asyncio
     async def test_timeout_pushes_partial(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
+        self,
+        aggregator: UserTurnAggregator,
+        mock_push_frame: PushCapture,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """After timeout expires, next frame triggers push of partial message."""
-        # Set up aggregator in DONE_AWAITING state with expired timeout
+        # Drive the aggregator's clock by hand (restored after the test, since
+        # the aggregator is shared across the module)
+        now = 100.0
+        monkeypatch.setattr(aggregator, "_now", lambda: now)
+
+        # Set up aggregator in DONE_AWAITING state, then let the timeout expire
         aggregator._state = UserTurnState.DONE_AWAITING_TRANSCRIPT
-        aggregator._aggregation = "partial message"
-        aggregator._done_received_at = 0  # Long ago - timeout expired
+        aggregator.append_text("partial message")
+        aggregator.mark_done_received()
+        now += aggregator._aggregation_timeout
 
         # Any frame should trigger the timeout check
         frame = TextFrame(text="unrelated")
-        await aggregator.process_frame(frame, FrameDirection.DOWNSTREAM)
+        await aggregator.process_frame(frame, _DOWN)
 
         # Should have pushed the partial message
         assert aggregator._state == UserTurnState.IDLE
@@ -310,115 +280,100 @@ class TestTimeoutBehavior:
 class TestFullConversationFlow:
     """Integration tests for complete conversation flows."""
 
-    @pytest.mark.asyncio
     async def test_simple_utterance(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
+        self,
+        aggregator: UserTurnAggregator,
+        mock_push_frame: PushCapture,
+        start_frame: UserStartedSpeakingFrame,
+        stop_frame: UserStoppedSpeakingFrame,
     ) -> None:
         """Test: user speaks, we get transcript, user stops → push message."""
         # User starts speaking
-        await aggregator.process_frame(
-            UserStartedSpeakingFrame(), FrameDirection.DOWNSTREAM
-        )
+        await aggregator.process_frame(start_frame, _DOWN)
         assert aggregator._state == UserTurnState.SPEAKING_AWAITING_TRANSCRIPT
 
         # Get a transcript
-        await aggregator.process_frame(
-            make_transcription("hello world"), FrameDirection.DOWNSTREAM
-        )
+        await aggregator.process_frame(make_transcription("hello world"), _DOWN)
         assert aggregator._state == UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT
         assert aggregator._aggregation == "hello world"
 
         # User stops speaking
-        await aggregator.process_frame(
-            UserStoppedSpeakingFrame(), FrameDirection.DOWNSTREAM
-        )
+        await aggregator.process_frame(stop_frame, _DOWN)
         assert aggregator._state == UserTurnState.IDLE
 
         # Check we pushed the message
-        calls = [c for c in mock_push_frame.call_args_list
-                 if isinstance(c[0][0], UserTurnMessageFrame)]
-        assert len(calls) == 1
-        assert calls[0][0][0].text == "hello world"
+        messages = mock_push_frame.pushed(UserTurnMessageFrame)
+        assert len(messages) == 1
+        assert messages[0].text == "hello world"
 
-    @pytest.mark.asyncio
     async def test_multiple_transcripts_per_turn(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
+        self,
+        aggregator: UserTurnAggregator,
+        mock_push_frame: PushCapture,
+        start_frame: UserStartedSpeakingFrame,
+        stop_frame: UserStoppedSpeakingFrame,
     ) -> None:
         """Test: multiple final transcripts aggregated into single message."""
-        await aggregator.process_frame(
-            UserStartedSpeakingFrame(), FrameDirection.DOWNSTREAM
-        )
-
         # Multiple transcripts (Deepgram sends finals at sentence boundaries)
-        await aggregator.process_frame(
-            make_transcription("Hello. "), FrameDirection.DOWNSTREAM
-        )
-        await aggregator.process_frame(
-            make_transcription("How are you? "), FrameDirection.DOWNSTREAM
-        )
-        await aggregator.process_frame(
-            make_transcription("I'm fine."), FrameDirection.DOWNSTREAM
+        await process_frames(
+            aggregator,
+            [
+                start_frame,
+                make_transcription("Hello. "),
+                make_transcription("How are you? "),
+                make_transcription("I'm fine."),
+            ],
         )
 
         assert aggregator._aggregation == "Hello. How are you? I'm fine."
 
         # User stops
-        await aggregator.process_frame(
-            UserStoppedSpeakingFrame(), FrameDirection.DOWNSTREAM
-        )
+        await aggregator.process_frame(stop_frame, _DOWN)
 
         # Check aggregated message
-        calls = [c for c in mock_push_frame.call_args_list
-                 if isinstance(c[0][0], UserTurnMessageFrame)]
-        assert len(calls) == 1
-        assert calls[0][0][0].text == "Hello. How are you? I'm fine."
+        messages = mock_push_frame.pushed(UserTurnMessageFrame)
+        assert len(messages) == 1
+        assert messages[0].text == "Hello. How are you? I'm fine."
 
-    @pytest.mark.asyncio
     async def test_race_condition_stop_before_final(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
+        self,
+        aggregator: UserTurnAggregator,
+        mock_push_frame: PushCapture,
+        start_frame: UserStartedSpeakingFrame,
+        stop_frame: UserStoppedSpeakingFrame,
     ) -> None:
         """Test: UserStoppedSpeakingFrame arrives before final transcript."""
-        await aggregator.process_frame(
-            UserStartedSpeakingFrame(), FrameDirection.DOWNSTREAM
-        )
+        await aggregator.process_frame(start_frame, _DOWN)
 
         # Got interim (signals more coming)
-        await aggregator.process_frame(
-            make_interim("hell"), FrameDirection.DOWNSTREAM
-        )
+        await aggregator.process_frame(make_interim("hell"), _DOWN)
         assert aggregator._pending_interim is True
 
         # User stops before final arrives
-        await aggregator.process_frame(
-            UserStoppedSpeakingFrame(), FrameDirection.DOWNSTREAM
-        )
+        await aggregator.process_frame(stop_frame, _DOWN)
         assert aggregator._state == UserTurnState.DONE_AWAITING_TRANSCRIPT
 
         # Final arrives after stop
-        await aggregator.process_frame(
-            make_transcription("hello"), FrameDirection.DOWNSTREAM
-        )
+        await aggregator.process_frame(make_transcription("hello"), _DOWN)
         assert aggregator._state == UserTurnState.IDLE
 
         # Should have pushed complete message
-        calls = [c for c in mock_push_frame.call_args_list
-                 if isinstance(c[0][0], UserTurnMessageFrame)]
-        assert len(calls) == 1
-        assert calls[0][0][0].text == "hello"
+        messages = mock_push_frame.pushed(UserTurnMessageFrame)
+        assert len(messages) == 1
+        assert messages[0].text == "hello"
 
-    @pytest.mark.asyncio
     async def test_upstream_frames_pass_through_unchanged(
-        self, aggregator: UserTurnAggregator, mock_push_frame: AsyncMock
+        self, aggregator: UserTurnAggregator, mock_push_frame: PushCapture
     ) -> None:
         """Upstream frames should pass through without state changes."""
         # Put aggregator in a non-idle state
         aggregator._state = UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT
-        aggregator._aggregation = "some text"
+        aggregator.append_text("some text")
 
         frame = TextFrame(text="upstream")
-        await aggregator.process_frame(frame, FrameDirection.UPSTREAM)
+        await aggregator.process_frame(frame, _UP)
 
         # State unchanged
         assert aggregator._state == UserTurnState.SPEAKING_RECEIVED_TRANSCRIPT
         assert aggregator._aggregation == "some text"
-        mock_push_frame.assert_called_once_with(frame, FrameDirection.UPSTREAM)
+        mock_push_frame.assert_called_once_with(frame, _UP)
@@ -0,0 +1,137 @@
+"""Tests for the agent config TTL cache."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from types import SimpleNamespace
+
+import pytest
+
+from kairix_agent import agent_config
+from kairix_agent.agent_config import (
+    AGENT_CONFIG_TTL_SECONDS,
+    clear_agent_config,
+    get_agent_config,
+)
+
+pytestmark = pytest.mark.asyncio
+
+AGENT_ID = "agent-1"
+LETTA_URL = "http://letta.test"
+
+
+async def aiter_of(*items: object) -> AsyncIterator[object]:
+    """Helper to turn items into an async iterator, like a Letta list call."""
+    for item in items:
+        yield item
+
+
+class FakeLetta:
+    """Stand-in for AsyncLetta that counts agent lookups.
+
+    While `release` is unset, retrieve waits, so concurrent loads overlap.
+    """
+
+    def __init__(self) -> None:
+        self.retrieves = 0
+        self.release = asyncio.Event()
+        self.release.set()
+        self.agents = SimpleNamespace(retrieve=self._retrieve, list=self._list_agents)
+        self.archives = SimpleNamespace(list=self._list_archives)
+
+    async def _retrieve(self, *, agent_id: str) -> SimpleNamespace:
+        self.retrieves += 1
+        await self.release.wait()
+        return SimpleNamespace(id=agent_id, name="Kairix")
+
+    def _list_archives(self, *, agent_id: str) -> AsyncIterator[object]:
+        return aiter_of(SimpleNamespace(id="archive-1", name="Memories"))
+
+    def _list_agents(self, *, name: str) -> AsyncIterator[object]:
+        return aiter_of(SimpleNamespace(id=f"{name}-id", name=name))
+
+
+class FakeClock:
+    """Stand-in for the time module with a monotonic clock moved by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def letta(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeLetta]:
+    """Serve configs from a FakeLetta, starting and ending with an empty cache."""
+    letta = FakeLetta()
+    monkeypatch.setattr(agent_config, "get_letta_client", lambda _url: letta)
+    clear_agent_config()
+    yield letta
+    clear_agent_config()
+    agent_config._config_locks.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the cache's clock, leaving the event loop's own clock alone."""
+    clock = FakeClock()
+    monkeypatch.setattr(agent_config, "time", clock)
+    return clock
+
+
+async def test_config_is_loaded(letta: FakeLetta) -> None:
+    """A load finds the agent's archive and its companion agents by name."""
+    config = await get_agent_config(agent_id=AGENT_ID, letta_url=LETTA_URL)
+
+    assert config.agent_name == "Kairix"
+    assert config.archive_id == "archive-1"
+    assert config.reflector_agent_id == "Kairix-Reflector-id"
+    assert config.insights_agent_id == "Kairix-BackgroundInsights-id"
+
+
+async def test_config_reused_within_ttl(letta: FakeLetta, clock: FakeClock) -> None:
+    """A config younger than the TTL is served from the cache."""
+    first = await get_agent_config(agent_id=AGENT_ID, letta_url=LETTA_URL)
+    clock.now += AGENT_CONFIG_TTL_SECONDS - 1
+
+    second = await get_agent_config(agent_id=AGENT_ID, letta_url=LETTA_URL)
+
+    assert second is first
+    assert letta.retrieves == 1
+
+
+async def test_config_reloaded_after_ttl(letta: FakeLetta, clock: FakeClock) -> None:
+    """A config older than the TTL is read from Letta again."""
+    first = await get_agent_config(agent_id=AGENT_ID, letta_url=LETTA_URL)
+    clock.now += AGENT_CONFIG_TTL_SECONDS
+
+    second = await get_agent_config(agent_id=AGENT_ID, letta_url=LETTA_URL)
+
+    assert second is not first
+    assert second == first
+    assert letta.retrieves == 2
+
+
+async def test_concurrent_callers_share_one_load(letta: FakeLetta) -> None:
+    """Callers that miss the cache together for the same key wait on a single load."""
+    letta.release.clear()
+    tasks = [
+        asyncio.create_task(get_agent_config(agent_id=AGENT_ID, letta_url=LETTA_URL))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    letta.release.set()
+
+    configs = await asyncio.gather(*tasks)
+
+    assert letta.retrieves == 1
+    assert all(config is configs[0] for config in configs)
+
+
+async def test_keys_include_letta_url(letta: FakeLetta) -> None:
+    """The same agent on two Letta servers is loaded once per server."""
+    await get_agent_config(agent_id=AGENT_ID, letta_url=LETTA_URL)
+    other = await get_agent_config(agent_id=AGENT_ID, letta_url="http://other.test")
+
+    assert other.letta_url == "http://other.test"
+    assert letta.retrieves == 2
@@ -0,0 +1,76 @@
+"""Tests for batching streamed response chunks."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
+import pytest
+
+from kairix_agent.server.coalesce import (
+    CHUNK_BATCH_DELAY_SECONDS,
+    CHUNK_BATCH_MAX,
+    coalesce_chunks,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class Source:
+    """Async chunk source that records whether it was closed."""
+
+    def __init__(self, chunks: list[str], *, pause_after: int | None = None) -> None:
+        self.closed = False
+        self._chunks = chunks
+        self._pause_after = pause_after
+
+    async def stream(self) -> AsyncIterator[str]:
+        try:
+            for i, chunk in enumerate(self._chunks):
+                if i == self._pause_after:
+                    # Go quiet for longer than the flush delay
+                    await asyncio.sleep(CHUNK_BATCH_DELAY_SECONDS * 4)
+                yield chunk
+        finally:
+            self.closed = True
+
+
+async def test_flushes_when_batch_is_full() -> None:
+    """A burst of chunks is sent in batches of CHUNK_BATCH_MAX."""
+    chunks = [str(i % 10) for i in range(CHUNK_BATCH_MAX + 2)]
+
+    batches = [batch async for batch in coalesce_chunks(Source(chunks).stream())]
+
+    assert batches == ["".join(chunks[:CHUNK_BATCH_MAX]), "".join(chunks[CHUNK_BATCH_MAX:])]
+
+
+async def test_flushes_partial_batch_after_delay() -> None:
+    """A partial batch is sent once the stream goes quiet, without ending the stream."""
+    source = Source(["a", "b", "c"], pause_after=2)
+
+    batches = [batch async for batch in coalesce_chunks(source.stream())]
+
+    assert batches == ["ab", "c"]
+    assert source.closed
+
+
+async def test_early_exit_closes_source() -> None:
+    """Stopping after the first batch closes the source stream."""
+    source = Source(["x"] * (CHUNK_BATCH_MAX * 3))
+
+    async with aclosing(coalesce_chunks(source.stream())) as batches:
+        first = await anext(batches)
+
+    assert first == "x" * CHUNK_BATCH_MAX
+    assert source.closed
+
+
+async def test_early_exit_during_pending_read_closes_source() -> None:
+    """Stopping while a read is still waiting on the source cancels it and closes the source."""
+    source = Source(["a", "b"], pause_after=1)
+
+    async with aclosing(coalesce_chunks(source.stream())) as batches:
+        # "a" is flushed by the delay while the read of "b" is still pending
+        first = await anext(batches)
+
+    assert first == "a"
+    assert source.closed
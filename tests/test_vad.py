@@ -0,0 +1,122 @@
+"""Tests for the resampling VAD's energy gate and resample path."""
+
+import numpy as np
+import pytest
+
+from kairix_agent.server.vad import (
+    INITIAL_NOISE_FLOOR,
+    NOISE_GATE_MARGIN,
+    ResamplingVADAnalyzer,
+)
+
+INPUT_SAMPLE_RATE = 48000
+
+# Samples per frame Silero takes at 16kHz
+SILERO_FRAME_SAMPLES = 512
+
+
+class SileroSpy:
+    """Stand-in for _silero_confidence that records each call's audio."""
+
+    def __init__(self, confidence: float) -> None:
+        self.confidence = confidence
+        self.calls: list[np.ndarray] = []
+
+    def __call__(self, audio: np.ndarray) -> float:
+        self.calls.append(audio.copy())
+        return self.confidence
+
+
+@pytest.fixture
+def analyzer() -> ResamplingVADAnalyzer:
+    """Create an analyzer taking 48kHz input."""
+    analyzer = ResamplingVADAnalyzer(input_sample_rate=INPUT_SAMPLE_RATE)
+    analyzer.set_sample_rate(INPUT_SAMPLE_RATE)
+    return analyzer
+
+
+def make_silence(samples: int) -> bytes:
+    """Helper to create an all-zero int16 frame."""
+    return np.zeros(samples, dtype=np.int16).tobytes()
+
+
+def make_tone(samples: int, amplitude: float, freq: float = 440.0) -> bytes:
+    """Helper to create a sine tone frame at the input rate, amplitude relative to full scale."""
+    t = np.arange(samples) / INPUT_SAMPLE_RATE
+    return (np.sin(2 * np.pi * freq * t) * amplitude * 32767).astype(np.int16).tobytes()
+
+
+def make_noise(samples: int, rms: float, seed: int) -> bytes:
+    """Helper to create a white noise frame with roughly the given RMS."""
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(samples) * rms * 32767).astype(np.int16).tobytes()
+
+
+def test_silence_skips_silero(
+    analyzer: ResamplingVADAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Frames below the noise floor score 0.0 without running Silero."""
+    spy = SileroSpy(confidence=1.0)
+    monkeypatch.setattr(analyzer, "_silero_confidence", spy)
+
+    confidence = analyzer.voice_confidence(make_silence(analyzer.num_frames_required()))
+
+    assert confidence == 0.0
+    assert spy.calls == []
+
+
+def test_loud_frame_runs_silero_without_moving_floor(
+    analyzer: ResamplingVADAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A frame Silero scores as speech is passed on and leaves the floor alone."""
+    spy = SileroSpy(confidence=0.9)
+    monkeypatch.setattr(analyzer, "_silero_confidence", spy)
+
+    confidence = analyzer.voice_confidence(make_tone(analyzer.num_frames_required(), 0.3))
+
+    assert confidence == 0.9
+    assert len(spy.calls) == 1
+    assert analyzer._noise_floor == INITIAL_NOISE_FLOOR
+
+
+def test_floor_rises_in_loud_room(
+    analyzer: ResamplingVADAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Steady noise Silero rejects raises the floor until the gate closes on it."""
+    spy = SileroSpy(confidence=0.0)
+    monkeypatch.setattr(analyzer, "_silero_confidence", spy)
+    samples = analyzer.num_frames_required()
+    room_rms = 0.05
+
+    for seed in range(200):
+        analyzer.voice_confidence(make_noise(samples, room_rms, seed))
+    calls_after_warmup = len(spy.calls)
+    for seed in range(200, 210):
+        analyzer.voice_confidence(make_noise(samples, room_rms, seed))
+
+    assert analyzer._noise_floor * NOISE_GATE_MARGIN > room_rms
+    assert len(spy.calls) == calls_after_warmup
+
+
+def test_resamples_to_silero_frame(
+    analyzer: ResamplingVADAnalyzer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """48kHz input reaches Silero as one frame of float32 samples within [-1, 1]."""
+    spy = SileroSpy(confidence=0.9)
+    monkeypatch.setattr(analyzer, "_silero_confidence", spy)
+
+    analyzer.voice_confidence(make_tone(analyzer.num_frames_required(), 1.0))
+
+    (audio,) = spy.calls
+    assert audio.shape == (SILERO_FRAME_SAMPLES,)
+    assert audio.dtype == np.float32
+    assert np.abs(audio).max() <= 1.0
+    # A 440Hz tone survives the anti-aliasing filter at close to full scale
+    assert np.abs(audio).max() > 0.9
+
+
+def test_real_silero_scores_resampled_tone(analyzer: ResamplingVADAnalyzer) -> None:
+    """The full path runs the real model on resampled audio and returns a probability."""
+    confidence = analyzer.voice_confidence(make_tone(analyzer.num_frames_required(), 0.3))
+
+    assert 0.0 <= confidence <= 1.0
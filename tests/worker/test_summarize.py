@@ -0,0 +1,103 @@
+"""Tests for fetching a session's messages for summarization."""
+
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+
+import pytest
+
+from kairix_agent.worker.jobs.summarize import _fetch_session_messages
+
+pytestmark = pytest.mark.asyncio
+
+AGENT_ID = "agent-1"
+
+
+def message(message_id: str, message_type: str) -> SimpleNamespace:
+    """Helper to create a message with just the fields the fetch looks at."""
+    return SimpleNamespace(id=message_id, message_type=message_type)
+
+
+class FakeLetta:
+    """Stand-in for AsyncLetta serving one agent's history in order.
+
+    Retrieve returns every message stored under an ID; list returns the
+    messages after the cursor, recording the arguments it was called with.
+    """
+
+    def __init__(self, history: list[SimpleNamespace]) -> None:
+        self.history = history
+        self.list_kwargs: dict[str, object] = {}
+        self.messages = SimpleNamespace(retrieve=self._retrieve)
+        self.agents = SimpleNamespace(messages=SimpleNamespace(list=self._list))
+
+    async def _retrieve(self, message_id: str) -> list[SimpleNamespace]:
+        return [msg for msg in self.history if msg.id == message_id]
+
+    def _list(
+        self, agent_id: str, *, after: str, **kwargs: object
+    ) -> AsyncIterator[SimpleNamespace]:
+        self.list_kwargs = {"agent_id": agent_id, "after": after, **kwargs}
+        ids = [msg.id for msg in self.history]
+        start = len(ids) - ids[::-1].index(after)
+        return self._iterate(self.history[start:])
+
+    async def _iterate(self, messages: list[SimpleNamespace]) -> AsyncIterator[SimpleNamespace]:
+        for msg in messages:
+            yield msg
+
+
+async def test_single_message_session_is_retrieved_by_id() -> None:
+    """A one-message session is fetched without listing."""
+    letta = FakeLetta([message("m1", "user_message"), message("m2", "user_message")])
+
+    messages = await _fetch_session_messages(letta, AGENT_ID, ["m1"])  # type: ignore[arg-type]
+
+    assert [msg.id for msg in messages] == ["m1"]
+    assert letta.list_kwargs == {}
+
+
+async def test_interleaved_messages_outside_session_are_dropped() -> None:
+    """Messages listed between session IDs that are not part of the session are left out."""
+    letta = FakeLetta(
+        [
+            message("m1", "user_message"),
+            message("m2", "reasoning_message"),
+            message("m2", "assistant_message"),
+            message("other", "user_message"),
+            message("m3", "user_message"),
+            message("m4", "assistant_message"),
+            message("after", "user_message"),
+        ]
+    )
+
+    messages = await _fetch_session_messages(letta, AGENT_ID, ["m1", "m2", "m3", "m4"])  # type: ignore[arg-type]
+
+    assert [(msg.id, msg.message_type) for msg in messages] == [
+        ("m1", "user_message"),
+        ("m2", "reasoning_message"),
+        ("m2", "assistant_message"),
+        ("m3", "user_message"),
+        ("m4", "assistant_message"),
+    ]
+    assert letta.list_kwargs["after"] == "m1"
+    assert letta.list_kwargs["order"] == "asc"
+
+
+async def test_stops_after_last_message_expansions() -> None:
+    """Every message sharing the last ID is kept, then listing stops."""
+    letta = FakeLetta(
+        [
+            message("m1", "user_message"),
+            message("m2", "reasoning_message"),
+            message("m2", "assistant_message"),
+            message("m3", "user_message"),
+        ]
+    )
+
+    messages = await _fetch_session_messages(letta, AGENT_ID, ["m1", "m2"])  # type: ignore[arg-type]
+
+    assert [(msg.id, msg.message_type) for msg in messages] == [
+        ("m1", "user_message"),
+        ("m2", "reasoning_message"),
+        ("m2", "assistant_message"),
+    ]